@@ -4,19 +4,15 @@ PM Bot API - Project Management AI Agent Backend
 Main application entry point
 """
 
-import os
 from app import create_app, db
 from app.models import *
-from flask_migrate import Migrate
-from config import config
+from config import get_config
 
-# Get environment
-env = os.environ.get('ENVIRONMENT', 'development')
-config_class = config.get(env, config['default'])
+# Resolve config for the current ENVIRONMENT
+config_class = get_config()
 
 # Create Flask app
 app = create_app(config_class)
-migrate = Migrate(app, db)
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -3,10 +3,10 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
-from config import config
+from config import get_config
+import click
 import logging
 from logging.handlers import RotatingFileHandler
-import os
 
 db = SQLAlchemy()
 migrate = Migrate()
@@ -16,8 +16,7 @@ def create_app(config_class=None):
     app = Flask(__name__)
     # Determine which config to use
     if config_class is None:
-        env = os.environ.get('ENVIRONMENT', 'development')
-        config_class = config[env]
+        config_class = get_config()
     
     app.config.from_object(config_class)
 
@@ -27,6 +26,11 @@ def create_app(config_class=None):
     # Initialize Flask extensions
     db.init_app(app)
     migrate.init_app(app, db)
+    
+    # Keep server-side timestamp defaults in UTC, like the Python-side ones
+    from app.db_utils import use_utc_sessions
+    with app.app_context():
+        use_utc_sessions(db.engine)
     jwt.init_app(app)
     CORS(app)
 
@@ -55,7 +59,8 @@ def create_app(config_class=None):
         """Shell context for flask shell"""
         from app.models import (User, Tenant, Project, Tool, ProjectTool, 
                                ChatSession, ChatMessage, TokenUsage, APIUsage, 
-                               AgentExecution, SystemConfig, ModelPricing)
+                               AgentExecution, SystemConfig, ModelPricing,
+                               TokenUsageDaily)
         return {
             'db': db, 
             'User': User, 
@@ -67,14 +72,22 @@ def create_app(config_class=None):
             'ChatMessage': ChatMessage,
             'TokenUsage': TokenUsage,
             'APIUsage': APIUsage,
+            'TokenUsageDaily': TokenUsageDaily,
             'AgentExecution': AgentExecution,
             'SystemConfig': SystemConfig,
             'ModelPricing': ModelPricing
         }
 
-    # Register AI Agents
-    with app.app_context():
-        _register_agents()
+    @app.cli.command('rollup-token-usage')
+    def rollup_token_usage():
+        """Roll completed days of token usage into token_usage_daily"""
+        from app.models import TokenUsageDaily
+        inserted = TokenUsageDaily.refresh()
+        click.echo(f"Rolled up {inserted} daily token usage rows")
+
+    # Register AI Agents on first use, so CLI commands don't import the agent stack
+    from app.agents.base import agent_registry
+    agent_registry.set_loader(_register_agents)
 
     return app
 
@@ -1,12 +1,23 @@
+import importlib
+
 from .base import BaseAgent, AgentContext, AgentResponse, AgentRegistry, agent_registry
-from .main import MainAgent
-from .analysis import AnalysisAgent
-from .management import ManagementAgent
-from .intelligence import agent_intelligence, AgentDecision, QueryAnalysis
+
+# The concrete agents pull in the whole LLM/intelligence stack, so they are
+# imported on first attribute access instead of with the package. Importing
+# app.agents.base (as create_app() does) then stays cheap, and the registry's
+# loader decides when they are actually loaded.
+_LAZY_ATTRS = {
+    'MainAgent': '.main',
+    'AnalysisAgent': '.analysis',
+    'ManagementAgent': '.management',
+    'agent_intelligence': '.intelligence',
+    'AgentDecision': '.intelligence',
+    'QueryAnalysis': '.intelligence',
+}
 
 __all__ = [
     'BaseAgent',
-    'AgentContext', 
+    'AgentContext',
     'AgentResponse',
     'AgentRegistry',
     'agent_registry',
@@ -16,4 +27,13 @@ __all__ = [
     'agent_intelligence',
     'AgentDecision',
     'QueryAnalysis'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the concrete agents on first use"""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
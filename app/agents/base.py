@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
 import json
+import threading
 import uuid
 from flask import current_app
 from app.llm import LLMManager, LLMResponse
@@ -12,6 +13,19 @@ from app import db
 from app.mcp import JiraProvider, AzureDevOpsProvider, GitHubProvider
 import re
 
+# Work items pulled into an agent's project context; the prompt only needs a sample
+_CONTEXT_WORK_ITEM_LIMIT = 20
+
+def _has_attrs(obj) -> bool:
+    """Check whether an object exposes attributes (plain objects or slotted dataclasses)"""
+    return hasattr(obj, '__dict__') or (is_dataclass(obj) and not isinstance(obj, type))
+
+def _attrs(obj) -> Dict[str, Any]:
+    """Get an object's attributes as a dict, supporting slotted dataclasses"""
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
 @dataclass
 class AgentContext:
     """Context for agent execution"""
@@ -113,6 +127,7 @@ class BaseAgent(ABC):
             
             if provider:
                 tool_data = {
+                    'id': tool.id,
                     'type': tool.tool_type.value,
                     'name': tool.name,
                     'base_url': tool.base_url,
@@ -124,7 +139,7 @@ class BaseAgent(ABC):
                 try:
                     # Get basic project data from the tool
                     if hasattr(provider, 'get_work_items'):
-                        work_items_response = provider.get_work_items(project.key)
+                        work_items_response = provider.get_work_items(project.key, max_results=_CONTEXT_WORK_ITEM_LIMIT)
                         if work_items_response.success:
                             tool_data['data']['work_items'] = work_items_response.data
                     
@@ -165,9 +180,9 @@ class BaseAgent(ABC):
                                 serialized[key].append(tool_data)
                             else:
                                 serialized[key].append(serialize_data(tool))
-                    elif hasattr(value, '__dict__'):
-                        # Convert objects with __dict__ to dictionary
-                        serialized[key] = serialize_data(value.__dict__)
+                    elif _has_attrs(value):
+                        # Convert objects with attributes to dictionary
+                        serialized[key] = serialize_data(_attrs(value))
                     elif isinstance(value, list):
                         serialized[key] = [serialize_data(item) for item in value]
                     elif isinstance(value, dict):
@@ -179,13 +194,13 @@ class BaseAgent(ABC):
                 return serialized
             elif isinstance(data, list):
                 return [serialize_data(item) for item in data]
-            elif hasattr(data, '__dict__'):
-                # Convert objects with __dict__ to dictionary
+            elif _has_attrs(data):
+                # Convert objects with attributes to dictionary
                 obj_dict = {}
-                for attr, value in data.__dict__.items():
+                for attr, value in _attrs(data).items():
                     if isinstance(value, datetime):
                         obj_dict[attr] = value.isoformat()
-                    elif hasattr(value, '__dict__'):
+                    elif _has_attrs(value):
                         obj_dict[attr] = serialize_data(value)
                     elif isinstance(value, list):
                         obj_dict[attr] = serialize_data(value)
@@ -257,7 +272,7 @@ class BaseAgent(ABC):
         
         formatted = "Work Items:\n"
         for item in work_items[:20]:  # Limit to avoid token overflow
-            if hasattr(item, '__dict__'):
+            if _has_attrs(item):
                 formatted += f"- ID: {item.id}, Title: {item.title}, Status: {item.status}"
                 if item.assignee:
                     formatted += f", Assignee: {item.assignee}"
@@ -276,7 +291,7 @@ class BaseAgent(ABC):
         
         formatted = "Sprints:\n"
         for sprint in sprints:
-            if hasattr(sprint, '__dict__'):
+            if _has_attrs(sprint):
                 formatted += f"- ID: {sprint.id}, Name: {sprint.name}, State: {sprint.state}"
                 if sprint.start_date:
                     formatted += f", Start: {sprint.start_date}"
@@ -293,17 +308,32 @@ class AgentRegistry:
     
     def __init__(self):
         self._agents: Dict[str, BaseAgent] = {}
+        self._loader: Optional[Callable[[], None]] = None
+        self._load_lock = threading.Lock()
     
     def register_agent(self, agent: BaseAgent):
         """Register an agent"""
         self._agents[agent.name] = agent
     
+    def set_loader(self, loader: Callable[[], None]):
+        """Defer agent construction (and its imports) to the first lookup"""
+        self._loader = loader
+    
+    def _ensure_loaded(self):
+        if self._loader is not None:
+            with self._load_lock:
+                if self._loader is not None:
+                    self._loader()
+                    self._loader = None
+    
     def get_agent(self, name: str) -> Optional[BaseAgent]:
         """Get an agent by name"""
+        self._ensure_loaded()
         return self._agents.get(name)
     
     def list_agents(self) -> List[str]:
         """List all registered agents"""
+        self._ensure_loaded()
         return list(self._agents.keys())
     
     def get_agent_for_query(self, query: str, context: AgentContext) -> Optional[BaseAgent]:
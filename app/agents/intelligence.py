@@ -1,12 +1,66 @@
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+import re
 from datetime import datetime
 from flask import current_app
 
-from app.mcp.unified_schema import EntityType, UnifiedQuery, TOOL_CAPABILITIES
+from app.mcp.unified_schema import EntityType, UnifiedQuery, TOOL_CAPABILITIES, ENTITY_VALUES
 from app.llm import LLMManager
 
 
+def _keyword_pattern(keywords):
+    """Compile keywords into one alternation that matches any of them as a substring"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+_ENTITY_KEYWORDS = {
+    'work items': ('work item', 'task', 'issue', 'story', 'bug', 'ticket', 'epic'),
+    'sprints': ('sprint', 'iteration', 'cycle'),
+    'users': ('user', 'assignee', 'team member', 'developer'),
+    'repositories': ('repo', 'repository', 'code', 'github'),
+    'pull requests': ('pr', 'pull request', 'merge request'),
+    'commits': ('commit', 'change', 'version')
+}
+
+_ACTION_KEYWORDS = {
+    'analyze': ('analyze', 'show', 'display', 'view', 'report', 'status', 'health', 'performance'),
+    'create': ('create', 'add', 'new', 'generate', 'make'),
+    'update': ('update', 'edit', 'change', 'modify', 'fix'),
+    'delete': ('delete', 'remove', 'cancel'),
+    'search': ('find', 'search', 'look for', 'get', 'fetch'),
+    'assign': ('assign', 'reassign', 'allocate'),
+    'move': ('move', 'transition', 'change status'),
+    'plan': ('plan', 'schedule', 'organize')
+}
+
+# One precompiled pattern per category: a single C-level scan of the query
+# replaces a Python-level substring test per keyword
+_ENTITY_PATTERNS = tuple((entity, _keyword_pattern(keywords)) for entity, keywords in _ENTITY_KEYWORDS.items())
+_ACTION_PATTERNS = tuple((action, _keyword_pattern(keywords)) for action, keywords in _ACTION_KEYWORDS.items())
+_ANY_ENTITY_PATTERN = _keyword_pattern(keyword for keywords in _ENTITY_KEYWORDS.values() for keyword in keywords)
+
+# Analysis entity names -> unified entity types, for the non-LLM fallback
+_ENTITY_TYPES = {
+    'work items': (EntityType.WORK_ITEM,),
+    'sprints': (EntityType.SPRINT,),
+    'users': (EntityType.USER,),
+    'repositories': (EntityType.REPOSITORY,),
+    'pull requests': (EntityType.PULL_REQUEST,),
+    'commits': (EntityType.COMMIT,)
+}
+
+# Per-tool entity list for the decision prompt, formatted once
+_TOOL_ENTITY_NAMES = {
+    tool_name: ', '.join(ENTITY_VALUES[e] for e in capabilities.supported_entities)
+    for tool_name, capabilities in TOOL_CAPABILITIES.items()
+}
+
+_TEMPORAL_KEYWORDS = ('today', 'yesterday', 'this week', 'last week', 'this month', 'last month',
+                      'current', 'recent', 'latest', 'past', 'upcoming', 'next')
+_STATUS_KEYWORDS = ('todo', 'in progress', 'done', 'blocked', 'open', 'closed')
+_PRIORITY_KEYWORDS = ('high', 'low', 'critical', 'medium')
+
+
 @dataclass
 class AgentDecision:
     """Represents a decision made by the intelligent agent"""
@@ -77,52 +131,19 @@ class AgentIntelligence:
         query_lower = query.lower()
         
         # Extract entities mentioned
-        entities_mentioned = []
-        entity_keywords = {
-            'work items': ['work item', 'task', 'issue', 'story', 'bug', 'ticket', 'epic'],
-            'sprints': ['sprint', 'iteration', 'cycle'],
-            'users': ['user', 'assignee', 'team member', 'developer'],
-            'repositories': ['repo', 'repository', 'code', 'github'],
-            'pull requests': ['pr', 'pull request', 'merge request'],
-            'commits': ['commit', 'change', 'version']
-        }
-        
-        for entity, keywords in entity_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                entities_mentioned.append(entity)
+        entities_mentioned = [entity for entity, pattern in _ENTITY_PATTERNS if pattern.search(query_lower)]
         
         # Extract action implications
-        actions_implied = []
-        action_keywords = {
-            'analyze': ['analyze', 'show', 'display', 'view', 'report', 'status', 'health', 'performance'],
-            'create': ['create', 'add', 'new', 'generate', 'make'],
-            'update': ['update', 'edit', 'change', 'modify', 'fix'],
-            'delete': ['delete', 'remove', 'cancel'],
-            'search': ['find', 'search', 'look for', 'get', 'fetch'],
-            'assign': ['assign', 'reassign', 'allocate'],
-            'move': ['move', 'transition', 'change status'],
-            'plan': ['plan', 'schedule', 'organize']
-        }
-        
-        for action, keywords in action_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                actions_implied.append(action)
+        actions_implied = [action for action, pattern in _ACTION_PATTERNS if pattern.search(query_lower)]
         
         # Extract temporal references
-        temporal_references = []
-        temporal_keywords = ['today', 'yesterday', 'this week', 'last week', 'this month', 'last month', 
-                           'current', 'recent', 'latest', 'past', 'upcoming', 'next']
-        
-        for keyword in temporal_keywords:
-            if keyword in query_lower:
-                temporal_references.append(keyword)
+        temporal_references = [keyword for keyword in _TEMPORAL_KEYWORDS if keyword in query_lower]
         
         # Extract specific filters (but be careful about "backlog")
         specific_filters = {}
         
         # Status filters - but NOT for "backlog" since it's not a JIRA status
-        status_keywords = ['todo', 'in progress', 'done', 'blocked', 'open', 'closed']
-        for status in status_keywords:
+        for status in _STATUS_KEYWORDS:
             if status in query_lower:
                 specific_filters['status'] = status
         
@@ -130,8 +151,7 @@ class AgentIntelligence:
         # The term "backlog" in project management means "items to be worked on", not a status
         
         # Priority filters
-        priority_keywords = ['high', 'low', 'critical', 'medium']
-        for priority in priority_keywords:
+        for priority in _PRIORITY_KEYWORDS:
             if priority in query_lower:
                 specific_filters['priority'] = priority
         
@@ -143,7 +163,7 @@ class AgentIntelligence:
                 content = msg.get('content', '').lower()
                 if 'project' in content:
                     context_clues.append('project_context')
-                if any(entity in content for entity_list in entity_keywords.values() for entity in entity_list):
+                if _ANY_ENTITY_PATTERN.search(content):
                     context_clues.append('entity_continuity')
         
         return QueryAnalysis(
@@ -235,7 +255,6 @@ Consider:
             
             # Parse JSON response
             import json
-            import re
             
             content = response.content.strip()
             json_match = re.search(r'\{.*\}', content, re.DOTALL)
@@ -308,26 +327,17 @@ Always provide clear reasoning for your decisions and consider the user's likely
             if tool_name in TOOL_CAPABILITIES:
                 capabilities = TOOL_CAPABILITIES[tool_name]
                 formatted += f"\n- **{tool_name.upper()}**: "
-                formatted += f"Entities: {', '.join([e.value for e in capabilities.supported_entities])}, "
+                formatted += f"Entities: {_TOOL_ENTITY_NAMES[tool_name]}, "
                 formatted += f"Operations: {', '.join(capabilities.supported_operations)}"
         return formatted
     
     def _fallback_decision_making(self, analysis: QueryAnalysis, available_tools: List[str]) -> Dict[str, Any]:
         """Fallback decision making when LLM fails"""
         # Map entities mentioned to entity types
-        entity_mapping = {
-            'work items': [EntityType.WORK_ITEM],
-            'sprints': [EntityType.SPRINT],
-            'users': [EntityType.USER],
-            'repositories': [EntityType.REPOSITORY],
-            'pull requests': [EntityType.PULL_REQUEST],
-            'commits': [EntityType.COMMIT]
-        }
-        
         entities_needed = []
         for entity in analysis.entities_mentioned:
-            if entity in entity_mapping:
-                entities_needed.extend(entity_mapping[entity])
+            if entity in _ENTITY_TYPES:
+                entities_needed.extend(_ENTITY_TYPES[entity])
         
         # If no entities mentioned, default to work items
         if not entities_needed:
@@ -341,13 +351,14 @@ Always provide clear reasoning for your decisions and consider the user's likely
             del filters['status']
         
         # Generate appropriate reasoning
-        reasoning = f"Fallback decision: {analysis.intent} action for {', '.join([e.value for e in entities_needed])}"
+        entity_values = [ENTITY_VALUES[e] for e in entities_needed]
+        reasoning = f"Fallback decision: {analysis.intent} action for {', '.join(entity_values)}"
         if 'backlog' in analysis.entities_mentioned or any('backlog' in entity for entity in analysis.entities_mentioned):
             reasoning = "User wants to view project backlog items (all work items in the project)"
         
         return {
             'action_type': analysis.intent,
-            'entities_needed': [e.value for e in entities_needed],
+            'entities_needed': entity_values,
             'tools_to_use': available_tools,
             'filters': filters,
             'reasoning': reasoning,
@@ -1,6 +1,7 @@
 import time
 import re
 import difflib
+import orjson
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from flask import current_app
@@ -1050,6 +1051,7 @@ The more details you provide, the better I can assist you!"""
             )
             
             created_items = []
+            pending = []
             project_key = tool.configuration.get('project_key')
             
             for item in work_items:
@@ -1082,17 +1084,7 @@ The more details you provide, the better I can assist you!"""
                             'user_story': item['user_story']
                         }
                     )
-                    
-                    # Create in JIRA
-                    response = provider.create_work_item(project_key, work_item)
-                    
-                    created_items.append({
-                        'title': item['title'],
-                        'success': response.success,
-                        'jira_key': response.data.get('key') if response.success else None,
-                        'url': response.data.get('url') if response.success else None,
-                        'error': response.error if not response.success else None
-                    })
+                    pending.append(work_item)
                     
                 except Exception as e:
                     created_items.append({
@@ -1101,6 +1093,20 @@ The more details you provide, the better I can assist you!"""
                         'error': str(e)
                     })
             
+            if pending:
+                # Create in JIRA, 50 issues per request
+                response = provider.create_work_items_bulk(project_key, pending)
+                results = response.data or [{'error': response.error} for _ in pending]
+                
+                for work_item, result in zip(pending, results):
+                    created_items.append({
+                        'title': work_item.title,
+                        'success': 'error' not in result,
+                        'jira_key': result.get('key'),
+                        'url': result.get('url'),
+                        'error': result.get('error')
+                    })
+            
             return created_items
             
         except Exception as e:
@@ -1316,7 +1322,8 @@ The more details you provide, the better I can assist you!"""
             )
             
             project_key = tool.configuration.get('project_key')
-            response = provider.get_work_items(project_key, max_results=1000)
+            response = provider.get_work_items(project_key, max_results=1000,
+                                               fields=['summary', 'description', 'status', 'created'])
             
             if not response.success:
                 return []
@@ -1695,7 +1702,7 @@ The more details you provide, the better I can assist you!"""
                 "issues": [work_item_id]
             }
             
-            response = provider._make_request('POST', f'../../rest/agile/1.0/sprint/{sprint_id}/issue', json=sprint_data)
+            response = provider._make_request('POST', f'../../rest/agile/1.0/sprint/{sprint_id}/issue', data=orjson.dumps(sprint_data))
             
             if response.status_code == 204:  # No content - success
                 return {
@@ -3,6 +3,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.api import bp
 from app.models import User, AgentExecution, db
 from app.agents.base import agent_registry
+from app.db_utils import safe_query
 from sqlalchemy import desc
 
 @bp.route('/agents', methods=['GET'])
@@ -46,7 +47,7 @@ def get_agent_executions():
         project_id = request.args.get('project_id', type=int)
         
         # Build query
-        query = AgentExecution.query.filter_by(user_id=user_id)
+        query = safe_query(AgentExecution).filter_by(user_id=user_id)
         
         if agent_type:
             query = query.filter_by(agent_type=agent_type)
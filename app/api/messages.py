@@ -8,6 +8,9 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.api import bp
 from app.models import User, ChatSession, ChatMessage, db
 from app.agents.base import AgentContext, agent_registry
+from app.db_utils import safe_query
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
@@ -365,9 +368,20 @@ def get_message_history(session_id):
         if not chat_session:
             return jsonify({'error': 'Session not found'}), 404
 
-        messages = ChatMessage.query.filter_by(
-            session_id=chat_session.id
-        ).order_by(ChatMessage.created_at.asc()).all()
+        limit = request.args.get('limit', type=int)
+        before = _parse_cursor(request.args.get('before'))
+        next_cursor = None
+        if limit or before:
+            # Keyset pagination: newest page first, returned oldest-first
+            limit = min(limit or 50, 200)
+            page = ChatMessage.page(chat_session.id, before=before, limit=limit)
+            if len(page) == limit:
+                next_cursor = f"{page[-1].created_at.isoformat()},{page[-1].id}"
+            messages = list(reversed(page))
+        else:
+            messages = safe_query(ChatMessage).filter_by(
+                session_id=chat_session.id
+            ).order_by(ChatMessage.created_at.asc()).all()
 
         history = []
         for msg in messages:
@@ -384,7 +398,8 @@ def get_message_history(session_id):
         return jsonify({
             'session_id': session_id,
             'messages': history,
-            'total_count': len(history)
+            'total_count': len(history),
+            'next_cursor': next_cursor
         }), 200
 
     except Exception as e:
@@ -398,16 +413,23 @@ def get_user_sessions():
     try:
         user_id = get_jwt_identity()
 
-        sessions = ChatSession.query.filter_by(
+        sessions = safe_query(ChatSession, joinedload(ChatSession.project)).filter_by(
             user_id=user_id,
             is_active=True
         ).order_by(ChatSession.updated_at.desc()).all()
 
+        # Latest message of every session in one query rather than one per session
+        latest_ids = select(func.max(ChatMessage.id)).where(
+            ChatMessage.session_id.in_([session.id for session in sessions])
+        ).group_by(ChatMessage.session_id)
+        last_messages = {
+            message.session_id: message
+            for message in safe_query(ChatMessage).filter(ChatMessage.id.in_(latest_ids))
+        } if sessions else {}
+
         session_list = []
         for session in sessions:
-            last_message = ChatMessage.query.filter_by(
-                session_id=session.id
-            ).order_by(ChatMessage.created_at.desc()).first()
+            last_message = last_messages.get(session.id)
 
             session_data = {
                 'session_id': session.session_id,
@@ -463,9 +485,7 @@ def delete_session(session_id):
 # -----------------------------
 
 def _get_conversation_history(session_id: int, limit: int = 10):
-    messages = ChatMessage.query.filter_by(
-        session_id=session_id
-    ).order_by(ChatMessage.created_at.desc()).limit(limit).all()
+    messages = ChatMessage.page(session_id, limit=limit)
 
     history = []
     for msg in reversed(messages):
@@ -475,4 +495,15 @@ def _get_conversation_history(session_id: int, limit: int = 10):
             'timestamp': msg.created_at.isoformat()
         })
 
-    return history
\ No newline at end of file
+    return history
+
+
+def _parse_cursor(cursor):
+    """Decode a "<created_at iso>,<id>" history cursor, or None if absent or malformed"""
+    if not cursor:
+        return None
+    created_at, _, message_id = cursor.rpartition(',')
+    try:
+        return datetime.fromisoformat(created_at), int(message_id)
+    except ValueError:
+        return None
@@ -0,0 +1,67 @@
+from types import MappingProxyType
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import configure_mappers, raiseload
+
+# Per-dialect statement that puts a connection's session time zone in UTC.
+# SQLite's CURRENT_TIMESTAMP is always UTC, so it needs none.
+_UTC_SESSION_SQL = MappingProxyType({
+    'mysql': "SET time_zone = '+00:00'",
+    'postgresql': "SET TIME ZONE 'UTC'",
+})
+
+
+def safe_query(model, *loads):
+    """Query model with only the given relationship loads allowed.
+    
+    Every other relationship is set to raiseload('*'), so touching one that
+    wasn't listed raises instead of silently issuing a SELECT per row.
+    """
+    return model.query.options(*loads, raiseload('*'))
+
+
+def use_utc_sessions(engine):
+    """Run every new connection of engine in UTC.
+    
+    Server-side timestamp defaults (NOW()) follow the session time zone, so
+    this keeps them consistent with the UTC values written from Python.
+    """
+    statement = _UTC_SESSION_SQL.get(engine.dialect.name)
+    if statement is None:
+        return
+    
+    @event.listens_for(engine, 'connect')
+    def _set_utc(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+        # PostgreSQL would undo the SET when the pool rolls the connection back
+        dbapi_connection.commit()
+
+
+def warm_up(app):
+    """Pay first-use costs at startup instead of on the first request.
+    
+    Builds the lazily registered agents, configures all mappers, opens the
+    first pooled connection and runs the hottest statements once so their
+    compiled SQL is already in the engine's statement cache.
+    """
+    from app import db
+    from app.models import ChatMessage, TokenUsage
+    
+    from app.agents.base import agent_registry
+    
+    with app.app_context():
+        configure_mappers()
+        agent_registry.list_agents()  # builds the agents and imports their dependencies
+        try:
+            db.session.execute(select(1))
+            ChatMessage.page(0, limit=1)
+            TokenUsage.totals(0)
+        except Exception as e:
+            app.logger.warning(f"Database warm-up skipped: {str(e)}")
+        finally:
+            db.session.rollback()
+
@@ -1,6 +1,4 @@
 from abc import ABC, abstractmethod
-import openai
-from anthropic import Anthropic
 from typing import Dict, Any, List, Optional
 from flask import current_app
 import time
@@ -35,6 +33,7 @@ class BaseLLMProvider(ABC):
 class OpenAIProvider(BaseLLMProvider):
     def __init__(self, api_key: str = None):
         super().__init__(api_key)
+        import openai  # deferred: the SDK is only needed once a provider is built
         openai.api_key = api_key or current_app.config.get('OPENAI_API_KEY')
         self.client = openai.OpenAI(api_key=self.api_key)
     
@@ -108,6 +107,7 @@ class AzureOpenAIProvider(BaseLLMProvider):
     def __init__(self, api_key: str = None, endpoint: str = None):
         super().__init__(api_key)
         self.endpoint = endpoint or current_app.config.get('AZURE_OPENAI_ENDPOINT')
+        import openai
         self.client = openai.AzureOpenAI(
             api_key=api_key or current_app.config.get('AZURE_OPENAI_API_KEY'),
             azure_endpoint=self.endpoint,
@@ -174,6 +174,7 @@ class AzureOpenAIProvider(BaseLLMProvider):
 class AnthropicProvider(BaseLLMProvider):
     def __init__(self, api_key: str = None):
         super().__init__(api_key)
+        from anthropic import Anthropic
         self.client = Anthropic(api_key=api_key or current_app.config.get('ANTHROPIC_API_KEY'))
     
     def generate_response(self, messages: List[Dict[str, str]], 
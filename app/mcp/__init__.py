@@ -1,12 +1,12 @@
 from .base import BaseMCPProvider, MCPResponse, WorkItem, Sprint, mcp_registry
-from .jira import JiraProvider
+from .jira import JiraProvider, AsyncJiraProvider
 from .github import GitHubProvider
 from .azure_devops import AzureDevOpsProvider
 from .unified_schema import (
     EntityType, UnifiedQuery, UnifiedResponse, UnifiedWorkItem, UnifiedSprint,
     UnifiedUser, UnifiedRepository, UnifiedPullRequest, UnifiedCommit,
     UnifiedComment, UnifiedProject, WorkItemType, WorkItemStatus, Priority,
-    TOOL_CAPABILITIES
+    TOOL_CAPABILITIES, ENTITY_VALUES
 )
 from .unified_service import unified_service
 
@@ -16,6 +16,7 @@ __all__ = [
     'WorkItem',
     'Sprint',
     'JiraProvider',
+    'AsyncJiraProvider',
     'GitHubProvider', 
     'AzureDevOpsProvider',
     'mcp_registry',
@@ -34,5 +35,6 @@ __all__ = [
     'WorkItemStatus',
     'Priority',
     'TOOL_CAPABILITIES',
+    'ENTITY_VALUES',
     'unified_service'
 ] 
\ No newline at end of file
@@ -3,7 +3,7 @@ import base64
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from .base import BaseMCPProvider, MCPResponse, WorkItem, Sprint
-import json
+import orjson
 
 class AzureDevOpsProvider(BaseMCPProvider):
     """Azure DevOps MCP Provider"""
@@ -47,7 +47,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
             response = self._make_request('GET', 'projects')
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 projects = []
                 
                 for project in data.get('value', []):
@@ -81,14 +81,18 @@ class AzureDevOpsProvider(BaseMCPProvider):
             if filters.get('work_item_type'):
                 wiql_query += f" AND [System.WorkItemType] = '{filters['work_item_type']}'"
             
-            # Execute WIQL query
+            if filters.get('order_by'):
+                wiql_query += f" ORDER BY {filters['order_by']}"
+            
+            # Execute WIQL query, letting the server cut the result to max_results
+            params = {'$top': filters['max_results']} if filters.get('max_results') else {}
             wiql_response = self._make_request('POST', f'wit/wiql', 
-                                             json={'query': wiql_query})
+                                             json={'query': wiql_query}, params=params)
             
             if wiql_response.status_code != 200:
                 return MCPResponse(success=False, error=f"WIQL query failed: {wiql_response.status_code}")
             
-            wiql_data = wiql_response.json()
+            wiql_data = orjson.loads(wiql_response.content)
             work_item_ids = [item['id'] for item in wiql_data.get('workItems', [])]
             
             if not work_item_ids:
@@ -102,7 +106,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
             if details_response.status_code != 200:
                 return MCPResponse(success=False, error=f"Failed to get work item details: {details_response.status_code}")
             
-            details_data = details_response.json()
+            details_data = orjson.loads(details_response.content)
             work_items = []
             
             for item in details_data.get('value', []):
@@ -187,7 +191,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
                                         json=document, headers=headers)
             
             if response.status_code == 200:
-                created_item = response.json()
+                created_item = orjson.loads(response.content)
                 return MCPResponse(success=True, data={
                     'id': created_item['id'],
                     'url': created_item['url']
@@ -231,7 +235,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
                                         json=document, headers=headers)
             
             if response.status_code == 200:
-                updated_item = response.json()
+                updated_item = orjson.loads(response.content)
                 return MCPResponse(success=True, data={
                     'id': updated_item['id'],
                     'url': updated_item['url']
@@ -248,7 +252,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
             response = self._make_request('GET', f'wit/workItems/{work_item_id}/comments')
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 comments = []
                 
                 for comment in data.get('comments', []):
@@ -276,7 +280,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
             if teams_response.status_code != 200:
                 return MCPResponse(success=False, error=f"Failed to get teams: {teams_response.status_code}")
             
-            teams_data = teams_response.json()
+            teams_data = orjson.loads(teams_response.content)
             all_sprints = []
             
             # Get iterations for each team
@@ -286,7 +290,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
                                                        params={'$timeframe': 'current'})
                 
                 if iterations_response.status_code == 200:
-                    iterations_data = iterations_response.json()
+                    iterations_data = orjson.loads(iterations_response.content)
                     
                     for iteration in iterations_data.get('value', []):
                         sprint = Sprint(
@@ -309,7 +313,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
             response = self._make_request('GET', f'projects/{project_id}/teams')
             
             if response.status_code == 200:
-                teams_data = response.json()
+                teams_data = orjson.loads(response.content)
                 all_members = []
                 
                 for team in teams_data.get('value', []):
@@ -317,7 +321,7 @@ class AzureDevOpsProvider(BaseMCPProvider):
                     members_response = self._make_request('GET', f'projects/{project_id}/teams/{team_id}/members')
                     
                     if members_response.status_code == 200:
-                        members_data = members_response.json()
+                        members_data = orjson.loads(members_response.content)
                         
                         for member in members_data.get('value', []):
                             all_members.append({
@@ -4,14 +4,14 @@ from dataclasses import dataclass
 from datetime import datetime
 import json
 
-@dataclass
+@dataclass(slots=True)
 class MCPResponse:
     success: bool
     data: Any = None
     error: str = None
     metadata: Dict[str, Any] = None
 
-@dataclass
+@dataclass(slots=True)
 class WorkItem:
     id: str
     title: str
@@ -25,7 +25,7 @@ class WorkItem:
     story_points: Optional[int] = None
     metadata: Dict[str, Any] = None
 
-@dataclass
+@dataclass(slots=True)
 class Repository:
     id: str
     name: str
@@ -38,7 +38,7 @@ class Repository:
     issues_count: int = 0
     pull_requests_count: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class PullRequest:
     id: str
     title: str
@@ -51,7 +51,7 @@ class PullRequest:
     updated_date: datetime
     url: str
 
-@dataclass
+@dataclass(slots=True)
 class Sprint:
     id: str
     name: str
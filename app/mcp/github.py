@@ -1,12 +1,21 @@
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Optional
 from .base import BaseRepositoryProvider, MCPResponse, Repository, PullRequest
-import json
+import orjson
 
 class GitHubProvider(BaseRepositoryProvider):
     """GitHub Repository MCP Provider"""
     
+    # Shared across instances so independent sub-requests can run concurrently
+    _pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='github-api')
+    
     def __init__(self, auth_token: str, config: Dict[str, Any] = None):
         super().__init__("https://api.github.com", auth_token, config)
         
@@ -14,15 +23,64 @@ class GitHubProvider(BaseRepositoryProvider):
         self.auth_header = {
             'Authorization': f'token {auth_token}',
             'Accept': 'application/vnd.github.v3+json',
+            'Accept-Encoding': ACCEPT_ENCODING,  # gzip/deflate, plus br when brotli is installed
             'Content-Type': 'application/json'
         }
+        
+        # Precomputed URL prefix so each request is a single concatenation
+        self._base = self.base_url + '/'
+        self._username: Optional[str] = None
+        
+        # Persistent session that retries transient 5xx/429 responses on GETs
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self.session.mount('https://', HTTPAdapter(max_retries=retry))
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _repo_prefix(repo_name: str, owner: str) -> str:
+        """Return the cached 'repos/{owner}/{repo_name}' endpoint prefix"""
+        return f'repos/{owner}/{repo_name}'
+    
+    def _get_username(self) -> str:
+        """Get the authenticated user's login, cached after the first lookup"""
+        if self._username is None:
+            user_response = self._make_request('GET', 'user')
+            if user_response.status_code != 200:
+                raise RuntimeError("Failed to get user info")
+            self._username = orjson.loads(user_response.content)['login']
+        return self._username
+    
+    def _repo_endpoint(self, repo_name: str, org: Optional[str], suffix: str = "") -> str:
+        """Build a repository endpoint, defaulting the owner to the authenticated user"""
+        owner = org or self._get_username()
+        prefix = self._repo_prefix(repo_name, owner)
+        return f'{prefix}/{suffix}' if suffix else prefix
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make authenticated request to GitHub API"""
-        url = f"{self.base_url}/{endpoint}"
+        url = self._base + endpoint
         kwargs.setdefault('headers', {}).update(self.auth_header)
         
-        response = requests.request(method, url, **kwargs)
+        response = self.session.request(method, url, **kwargs)
+        
+        # Secondary rate limit: wait for the window to reset, then retry once
+        if response.status_code == 403 and response.headers.get('X-RateLimit-Remaining') == '0':
+            reset_at = response.headers.get('X-RateLimit-Reset')
+            if reset_at:
+                wait = max(0.0, int(reset_at) - time.time())
+                if wait <= self.config.get('max_rate_limit_wait', 60):
+                    time.sleep(wait)
+                    response = self.session.request(method, url, **kwargs)
+        
         return response
     
     def test_connection(self) -> MCPResponse:
@@ -30,7 +88,7 @@ class GitHubProvider(BaseRepositoryProvider):
         try:
             response = self._make_request('GET', 'user')
             if response.status_code == 200:
-                user_data = response.json()
+                user_data = orjson.loads(response.content)
                 return MCPResponse(success=True, data={
                     "message": "Connection successful",
                     "user": user_data.get('login')
@@ -51,7 +109,7 @@ class GitHubProvider(BaseRepositoryProvider):
             response = self._make_request('GET', endpoint, params={'per_page': 100})
             
             if response.status_code == 200:
-                repos_data = response.json()
+                repos_data = orjson.loads(response.content)
                 repositories = []
                 
                 for repo in repos_data:
@@ -79,21 +137,12 @@ class GitHubProvider(BaseRepositoryProvider):
     def get_repository(self, repo_name: str, org: str = None) -> MCPResponse:
         """Get repository details"""
         try:
-            if org:
-                endpoint = f'repos/{org}/{repo_name}'
-            else:
-                # Get authenticated user's repo
-                user_response = self._make_request('GET', 'user')
-                if user_response.status_code == 200:
-                    username = user_response.json()['login']
-                    endpoint = f'repos/{username}/{repo_name}'
-                else:
-                    return MCPResponse(success=False, error="Failed to get user info")
+            endpoint = self._repo_endpoint(repo_name, org)
             
             response = self._make_request('GET', endpoint)
             
             if response.status_code == 200:
-                repo = response.json()
+                repo = orjson.loads(response.content)
                 repository = Repository(
                     id=str(repo['id']),
                     name=repo['name'],
@@ -117,20 +166,12 @@ class GitHubProvider(BaseRepositoryProvider):
     def get_pull_requests(self, repo_name: str, org: str = None, state: str = "open") -> MCPResponse:
         """Get pull requests"""
         try:
-            if org:
-                endpoint = f'repos/{org}/{repo_name}/pulls'
-            else:
-                user_response = self._make_request('GET', 'user')
-                if user_response.status_code == 200:
-                    username = user_response.json()['login']
-                    endpoint = f'repos/{username}/{repo_name}/pulls'
-                else:
-                    return MCPResponse(success=False, error="Failed to get user info")
+            endpoint = self._repo_endpoint(repo_name, org, 'pulls')
             
             response = self._make_request('GET', endpoint, params={'state': state, 'per_page': 100})
             
             if response.status_code == 200:
-                prs_data = response.json()
+                prs_data = orjson.loads(response.content)
                 pull_requests = []
                 
                 for pr in prs_data:
@@ -158,20 +199,12 @@ class GitHubProvider(BaseRepositoryProvider):
     def get_issues(self, repo_name: str, org: str = None, state: str = "open") -> MCPResponse:
         """Get repository issues"""
         try:
-            if org:
-                endpoint = f'repos/{org}/{repo_name}/issues'
-            else:
-                user_response = self._make_request('GET', 'user')
-                if user_response.status_code == 200:
-                    username = user_response.json()['login']
-                    endpoint = f'repos/{username}/{repo_name}/issues'
-                else:
-                    return MCPResponse(success=False, error="Failed to get user info")
+            endpoint = self._repo_endpoint(repo_name, org, 'issues')
             
             response = self._make_request('GET', endpoint, params={'state': state, 'per_page': 100})
             
             if response.status_code == 200:
-                issues_data = response.json()
+                issues_data = orjson.loads(response.content)
                 issues = []
                 
                 for issue in issues_data:
@@ -202,15 +235,7 @@ class GitHubProvider(BaseRepositoryProvider):
     def get_commits(self, repo_name: str, org: str = None, branch: str = None) -> MCPResponse:
         """Get repository commits"""
         try:
-            if org:
-                endpoint = f'repos/{org}/{repo_name}/commits'
-            else:
-                user_response = self._make_request('GET', 'user')
-                if user_response.status_code == 200:
-                    username = user_response.json()['login']
-                    endpoint = f'repos/{username}/{repo_name}/commits'
-                else:
-                    return MCPResponse(success=False, error="Failed to get user info")
+            endpoint = self._repo_endpoint(repo_name, org, 'commits')
             
             params = {'per_page': 100}
             if branch:
@@ -219,7 +244,7 @@ class GitHubProvider(BaseRepositoryProvider):
             response = self._make_request('GET', endpoint, params=params)
             
             if response.status_code == 200:
-                commits_data = response.json()
+                commits_data = orjson.loads(response.content)
                 commits = []
                 
                 for commit in commits_data:
@@ -242,20 +267,12 @@ class GitHubProvider(BaseRepositoryProvider):
     def get_branches(self, repo_name: str, org: str = None) -> MCPResponse:
         """Get repository branches"""
         try:
-            if org:
-                endpoint = f'repos/{org}/{repo_name}/branches'
-            else:
-                user_response = self._make_request('GET', 'user')
-                if user_response.status_code == 200:
-                    username = user_response.json()['login']
-                    endpoint = f'repos/{username}/{repo_name}/branches'
-                else:
-                    return MCPResponse(success=False, error="Failed to get user info")
+            endpoint = self._repo_endpoint(repo_name, org, 'branches')
             
             response = self._make_request('GET', endpoint, params={'per_page': 100})
             
             if response.status_code == 200:
-                branches_data = response.json()
+                branches_data = orjson.loads(response.content)
                 branches = []
                 
                 for branch in branches_data:
@@ -276,24 +293,16 @@ class GitHubProvider(BaseRepositoryProvider):
     def get_repository_stats(self, repo_name: str, org: str = None) -> MCPResponse:
         """Get repository statistics"""
         try:
-            if org:
-                repo_endpoint = f'repos/{org}/{repo_name}'
-                contributors_endpoint = f'repos/{org}/{repo_name}/contributors'
-            else:
-                user_response = self._make_request('GET', 'user')
-                if user_response.status_code == 200:
-                    username = user_response.json()['login']
-                    repo_endpoint = f'repos/{username}/{repo_name}'
-                    contributors_endpoint = f'repos/{username}/{repo_name}/contributors'
-                else:
-                    return MCPResponse(success=False, error="Failed to get user info")
+            repo_endpoint = self._repo_endpoint(repo_name, org)
+            contributors_endpoint = self._repo_endpoint(repo_name, org, 'contributors')
             
-            # Get basic repo info
-            repo_response = self._make_request('GET', repo_endpoint)
-            contributors_response = self._make_request('GET', contributors_endpoint)
+            # Fetch repo info and contributors concurrently
+            repo_future = self._pool.submit(self._make_request, 'GET', repo_endpoint)
+            contributors_future = self._pool.submit(self._make_request, 'GET', contributors_endpoint)
+            repo_response, contributors_response = repo_future.result(), contributors_future.result()
             
             if repo_response.status_code == 200:
-                repo_data = repo_response.json()
+                repo_data = orjson.loads(repo_response.content)
                 stats = {
                     'name': repo_data['name'],
                     'stars': repo_data['stargazers_count'],
@@ -306,7 +315,7 @@ class GitHubProvider(BaseRepositoryProvider):
                 }
                 
                 if contributors_response.status_code == 200:
-                    contributors_data = contributors_response.json()
+                    contributors_data = orjson.loads(contributors_response.content)
                     stats['contributors_count'] = len(contributors_data)
                     stats['top_contributors'] = [
                         {
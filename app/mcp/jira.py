@@ -1,9 +1,29 @@
 import requests
-import base64
+import asyncio
+import aiohttp
+import hashlib
+import sys
+import threading
+import time
+from cachetools import LRUCache, TTLCache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterator, List, Mapping, Optional
 from .base import BaseMCPProvider, MCPResponse, WorkItem, Sprint
-import json
+from .unified_schema import TOOL_CAPABILITIES
+import orjson
+
+try:
+    # Optional C-accelerated ISO 8601 parser for large issue syncs
+    from ciso8601 import parse_datetime as _ciso8601_parse
+except ImportError:
+    _ciso8601_parse = None
 
 try:
     from flask import current_app
@@ -11,37 +31,456 @@ except ImportError:
     # Fallback for when Flask context is not available
     current_app = None
 
+# Upper bound on simultaneous connections the async provider opens to JIRA
+JIRA_MAX_CONCURRENT_REQUESTS = 5
+# Seconds before a JIRA call is abandoned unless the caller passes timeout=
+JIRA_REQUEST_TIMEOUT = 30
+# Connections kept per host; thread-pool fan-outs are capped to this
+_POOL_MAXSIZE = 32
+
+# Responses for slow-changing endpoints (projects, boards, sprints) are cached
+# for a few minutes. The cache is module level because agents construct a new
+# provider per request; keys include the server and a digest of the credential
+# so different tokens never read each other's responses.
+_response_cache = TTLCache(maxsize=5000, ttl=300)
+_response_cache_lock = threading.Lock()
+_response_cache_stats = {'hits': 0, 'misses': 0, 'revalidated': 0}
+# Last (ETag, response) per cache key, kept after the TTL entry expires so the
+# next fetch can be a conditional GET that costs no body on 304
+_etag_cache = LRUCache(maxsize=5000)
+_AGILE_BOARD_ENDPOINT = '../../rest/agile/1.0/board'
+
+# accountId per (server, lowercased display name or email) for assignee lookups
+_user_cache = TTLCache(maxsize=512, ttl=300)
+_user_cache_lock = threading.Lock()
+
+# Every request counts against the declared per-user budget; write verbs are
+# additionally throttled per second and retried on 429 (the adapter's Retry
+# only replays idempotent requests, honouring Retry-After)
+_REQUESTS_PER_MINUTE = TOOL_CAPABILITIES['jira'].rate_limits['requests_per_minute']
+_WRITE_METHODS = frozenset({'POST', 'PUT', 'DELETE'})
+_MAX_RATE_LIMIT_RETRIES = 3
+_MAX_RETRY_AFTER_SECONDS = 60
+
+# JIRA accepts at most 50 issueUpdates per POST issue/bulk
+_BULK_CREATE_LIMIT = 50
+
+class _SlidingWindowLimiter:
+    """Thread-safe limiter allowing at most max_calls per period seconds"""
+    
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def _try_acquire(self) -> float:
+        """Take a slot and return 0, or return the seconds until one frees up"""
+        with self._lock:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) < self.max_calls:
+                self._calls.append(now)
+                return 0.0
+            return self.period - (now - self._calls[0])
+    
+    def acquire(self):
+        """Block until another call fits in the window"""
+        while (wait := self._try_acquire()) > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until another call fits in the window"""
+        while (wait := self._try_acquire()) > 0:
+            await asyncio.sleep(wait)
+
+@lru_cache(maxsize=None)
+def _write_limiter(server_url: str, per_second: int) -> _SlidingWindowLimiter:
+    """Shared write limiter per JIRA server, so every provider instance draws from one budget"""
+    return _SlidingWindowLimiter(per_second, 1.0)
+
+@lru_cache(maxsize=None)
+def _request_limiter(server_url: str, username: str, per_minute: int) -> _SlidingWindowLimiter:
+    """Shared per-user request budget on a JIRA server"""
+    return _SlidingWindowLimiter(per_minute, 60.0)
+
+def _retry_after_seconds(headers: Mapping[str, str], attempt: int) -> float:
+    """Seconds to wait before retrying a 429, from Retry-After or exponential backoff"""
+    try:
+        delay = float(headers.get('Retry-After', ''))
+    except ValueError:
+        delay = 2 ** attempt
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER_SECONDS)
+
+# JSON content negotiation shared by every JIRA session; credentials go on
+# the session's auth instead of a hand-encoded header
+_JSON_HEADERS = MappingProxyType({
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+})
+
+def _is_cacheable(endpoint: str) -> bool:
+    """Check whether GET responses for an endpoint may be served from cache"""
+    return endpoint == 'project' or endpoint.startswith(_AGILE_BOARD_ENDPOINT)
+
+# Work item filter name -> JQL field, in the order clauses are emitted
+_FILTER_TO_JQL = {
+    'status': 'status',
+    'assignee': 'assignee',
+    'issue_type': 'issuetype',
+    'sprint': 'sprint'
+}
+
+# Issue fields requested from /search unless the caller passes fields=
+# (customfield_10016 is usually story points). Callers that don't need the ADF
+# description, usually the largest field, can pass a narrower list.
+_SEARCH_FIELDS = ('summary', 'description', 'status', 'assignee', 'labels', 'created', 'updated', 'priority',
+                  'customfield_10016')
+# WorkItem update keys and the JIRA fields they set
+_FIELD_MAPPING = MappingProxyType({
+    'title': 'summary',
+    'description': 'description',
+    'assignee': 'assignee',
+    'priority': 'priority',
+    'labels': 'labels',
+    'story_points': 'customfield_10016'
+})
+# Default maxResults per /search page (the classic endpoint's ceiling)
+_SEARCH_BATCH_SIZE = 100
+
+def _build_search_params(project_id: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build JQL search parameters from work item filters"""
+    jql_parts = [f'project = "{project_id}"']
+    jql_parts.extend(f'{jql_field} = "{filters[key]}"'
+                     for key, jql_field in _FILTER_TO_JQL.items() if filters.get(key))
+    
+    # Page size is batch_size, never more than the caller wants in total;
+    # the server may still return less and the remaining pages follow
+    page_size = filters.get('batch_size') or _SEARCH_BATCH_SIZE
+    if filters.get('max_results'):
+        page_size = min(page_size, filters['max_results'])
+    
+    jql = ' AND '.join(jql_parts)
+    if filters.get('order_by'):
+        jql += f" ORDER BY {filters['order_by']}"
+    
+    return {
+        'jql': jql,
+        'fields': ','.join(filters.get('fields') or _SEARCH_FIELDS),
+        'maxResults': page_size
+    }
+
+def _search_page_offsets(data: Dict[str, Any], filters: Dict[str, Any]) -> range:
+    """startAt offsets of the search pages still needed after the first page"""
+    page_size = len(data.get('issues', []))
+    wanted = data.get('total', page_size)
+    if filters.get('max_results'):
+        wanted = min(wanted, filters['max_results'])
+    return range(page_size, wanted, page_size) if page_size else range(0)
+
+def _parse_project(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a JIRA project payload to the provider's project dict"""
+    return {
+        'id': project['id'],
+        'key': project['key'],
+        'name': project['name'],
+        'description': project.get('description', ''),
+        'lead': project.get('lead', {}).get('displayName'),
+        'projectTypeKey': project.get('projectTypeKey'),
+        'url': project.get('self')
+    }
+
+if _ciso8601_parse is not None:
+    def _parse_jira_dt(value: Optional[str]) -> Optional[datetime]:
+        """Parse a JIRA timestamp with the ciso8601 C parser"""
+        return _ciso8601_parse(value) if value else None
+elif sys.version_info >= (3, 11):
+    def _parse_jira_dt(value: Optional[str]) -> Optional[datetime]:
+        """Parse a JIRA timestamp; fromisoformat accepts a trailing 'Z' natively"""
+        return datetime.fromisoformat(value) if value else None
+else:
+    def _parse_jira_dt(value: Optional[str]) -> Optional[datetime]:
+        """Parse a JIRA timestamp, rewriting a trailing 'Z' for older fromisoformat"""
+        if not value:
+            return None
+        return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+# ADF nodes that start a new line when flattened to plain text
+_ADF_BLOCK_TYPES = frozenset({'paragraph', 'heading', 'codeBlock', 'listItem', 'blockquote'})
+
+def _adf_to_text(document: Optional[Dict[str, Any]]) -> str:
+    """Flatten every text run of an Atlassian Document Format (ADF) document"""
+    if not document:
+        return ''
+    try:
+        parts = []
+        stack = [document]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            node_type = node.get('type')
+            if node_type == 'text':
+                parts.append(node.get('text', ''))
+            elif node_type == 'hardBreak' or (node_type in _ADF_BLOCK_TYPES and parts and parts[-1] != '\n'):
+                parts.append('\n')
+            stack.extend(reversed(node.get('content') or ()))
+        return ''.join(parts).strip('\n')
+    except (TypeError, AttributeError):
+        return ''
+
+def _parse_issue(issue: Dict[str, Any], base_url: str) -> WorkItem:
+    """Convert a JIRA issue payload to a WorkItem"""
+    key = issue['key']
+    fields = issue.get('fields') or {}
+    status = fields.get('status') or {}
+    assignee = fields.get('assignee') or {}
+    priority = fields.get('priority') or {}
+    issue_type = fields.get('issuetype') or {}
+    
+    return WorkItem(
+        id=key,
+        title=fields.get('summary', ''),
+        description=_adf_to_text(fields.get('description')),
+        status=status.get('name', ''),
+        assignee=assignee.get('displayName'),
+        labels=fields.get('labels', []),
+        created_date=_parse_jira_dt(fields.get('created')),
+        updated_date=_parse_jira_dt(fields.get('updated')),
+        priority=priority.get('name'),
+        story_points=fields.get('customfield_10016'),  # Story points custom field
+        metadata={
+            'issue_type': issue_type.get('name'),
+            'project_key': key.split('-')[0],
+            'url': f"{base_url}/browse/{key}"
+        }
+    )
+
+def _parse_comment(comment: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a JIRA comment payload to the provider's comment dict"""
+    return {
+        'id': comment['id'],
+        'body': _adf_to_text(comment.get('body')),
+        'author': comment.get('author', {}).get('displayName'),
+        'created': comment.get('created'),
+        'updated': comment.get('updated')
+    }
+
+def _expanded_board_sprints(boards: List[Dict[str, Any]]) -> Optional[List[Sprint]]:
+    """Sprints inlined in a board listing by expand=sprints, or None if the server didn't expand them"""
+    sprints = []
+    for board in boards:
+        inline = board.get('sprints')
+        if inline is None:
+            return None
+        if isinstance(inline, dict):
+            inline = inline.get('values', [])
+        sprints.extend(_parse_sprint(sprint) for sprint in inline)
+    return sprints
+
+def _parse_sprint(sprint: Dict[str, Any]) -> Sprint:
+    """Convert a JIRA agile sprint payload to a Sprint"""
+    return Sprint(
+        id=str(sprint['id']),
+        name=sprint['name'],
+        state=sprint['state'],
+        start_date=_parse_jira_dt(sprint.get('startDate')),
+        end_date=_parse_jira_dt(sprint.get('endDate')),
+        goal=sprint.get('goal')
+    )
+
+def _adf_doc(text: str) -> Dict[str, Any]:
+    """Wrap plain text in a single-paragraph Atlassian Document Format doc"""
+    return {"type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]}
+
+def _transition_result(work_item_id: str, response: requests.Response) -> MCPResponse:
+    """MCPResponse for a POST to issue/{key}/transitions (204 on success)"""
+    if response.status_code == 204:
+        return MCPResponse(success=True, data={'key': work_item_id})
+    error_msg = f"Failed to transition issue: {response.status_code}"
+    if response.text:
+        error_msg += f" - {response.text}"
+    return MCPResponse(success=False, error=error_msg)
+
+def _build_issue_fields(project_id: str, work_item: WorkItem) -> Dict[str, Any]:
+    """Compose the JIRA create-issue fields for a WorkItem"""
+    # Default issue type if not specified
+    issue_type = work_item.metadata.get('issue_type', 'Story') if work_item.metadata else 'Story'
+    
+    fields = {
+        "project": {"key": project_id},
+        "summary": work_item.title,
+        "description": _adf_doc(work_item.description),
+        "issuetype": {"name": issue_type}
+    }
+    
+    # Skip priority field as it's not available in this JIRA configuration
+    if work_item.assignee:
+        fields["assignee"] = {"displayName": work_item.assignee}
+    if work_item.labels:
+        fields["labels"] = work_item.labels  # JIRA expects array of strings
+    if work_item.story_points:
+        fields["customfield_10016"] = work_item.story_points  # Story points (common custom field ID)
+    return fields
+
+def _bulk_create_chunks(project_id: str, items: List[WorkItem]) -> List[Dict[str, Any]]:
+    """issue/bulk payloads for items, at most _BULK_CREATE_LIMIT per payload"""
+    return [
+        {"issueUpdates": [{"fields": _build_issue_fields(project_id, item)}
+                          for item in items[start:start + _BULK_CREATE_LIMIT]]}
+        for start in range(0, len(items), _BULK_CREATE_LIMIT)
+    ]
+
+def _bulk_create_results(status: int, body: Optional[Dict[str, Any]], count: int, base_url: str,
+                         detail: Any = None) -> List[Dict[str, Any]]:
+    """Align a bulk-create response with the count submitted elements
+    
+    detail is reported for every element when the whole request failed.
+    """
+    body = body or {}
+    if status not in (200, 201) and not body.get('errors'):
+        error = f"Failed to create issue: {status}" + (f" - {detail}" if detail else '')
+        return [{'error': error} for _ in range(count)]
+    
+    # Created issues come back in submission order, skipping failed elements
+    errors = {err.get('failedElementNumber'): err for err in body.get('errors', [])}
+    created = iter(body.get('issues', []))
+    results = []
+    for index in range(count):
+        if index in errors:
+            err = errors[index]
+            results.append({'error': f"Failed to create issue: {err.get('status')} - {err.get('elementErrors')}"})
+            continue
+        issue = next(created, None)
+        if issue is None:
+            results.append({'error': "Failed to create issue: missing from bulk response"})
+        else:
+            results.append({
+                'key': issue['key'],
+                'id': issue['id'],
+                'url': f"{base_url}/browse/{issue['key']}"
+            })
+    return results
+
 class JiraProvider(BaseMCPProvider):
     """JIRA MCP Provider"""
     
     def __init__(self, server_url: str, username: str, api_token: str, config: Dict[str, Any] = None):
         super().__init__(server_url, api_token, config)
         self.username = username
+        # Cached responses are keyed on the credential too, so a wrong or rotated
+        # token never reads what another token fetched
+        self._credential_digest = hashlib.sha256(f"{username}:{api_token}".encode()).hexdigest()
         
-        # Setup authentication
-        auth_string = f"{username}:{api_token}"
-        auth_bytes = base64.b64encode(auth_string.encode()).decode()
-        
-        self.auth_header = {
-            'Authorization': f'Basic {auth_bytes}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        # Persistent session so TCP/TLS connections are reused across calls. The
+        # adapter only retries GETs; writes are retried on 429 by _send alone
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=('GET',),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=_POOL_MAXSIZE, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+        self._session = requests.Session()
+        self._session.auth = (username, api_token)
+        self._session.headers.update(_JSON_HEADERS)
+        self._session.headers['Accept-Encoding'] = ACCEPT_ENCODING  # adds br when brotli is installed
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+    
+    def close(self):
+        """Release pooled connections"""
+        self._session.close()
+    
+    def __del__(self):
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make authenticated request to JIRA API"""
         url = f"{self.base_url}/rest/api/3/{endpoint}"
-        kwargs.setdefault('headers', {}).update(self.auth_header)
         
-        response = requests.request(method, url, **kwargs)
+        cache_key = validated = None
+        if method == 'GET' and _is_cacheable(endpoint):
+            params = kwargs.get('params') or {}
+            cache_key = (self.base_url, self._credential_digest, endpoint, tuple(sorted(params.items())))
+            with _response_cache_lock:
+                cached = _response_cache.get(cache_key)
+                if cached is not None:
+                    _response_cache_stats['hits'] += 1
+                    return cached
+                _response_cache_stats['misses'] += 1
+                validated = _etag_cache.get(cache_key)
+            if validated is not None:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), 'If-None-Match': validated[0]}
+        
+        response = self._send(method, url, **kwargs)
+        
+        if cache_key is not None:
+            if response.status_code == 304 and validated is not None:
+                # Unchanged since the last fetch: reuse the stored body
+                response = validated[1]
+                with _response_cache_lock:
+                    _response_cache_stats['revalidated'] += 1
+            if response.status_code == 200:
+                with _response_cache_lock:
+                    _response_cache[cache_key] = response
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        _etag_cache[cache_key] = (etag, response)
+        
+        return response
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request within the rate budget, backing off when JIRA answers 429 to a write"""
+        kwargs.setdefault('timeout', self.config.get('request_timeout', JIRA_REQUEST_TIMEOUT))
+        budget = _request_limiter(self.base_url, self.username,
+                                  self.config.get('requests_per_minute', _REQUESTS_PER_MINUTE))
+        if method not in _WRITE_METHODS:
+            budget.acquire()
+            return self._session.request(method, url, **kwargs)
+        
+        limiter = _write_limiter(self.base_url, self.config.get('write_requests_per_second', 10))
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            budget.acquire()
+            limiter.acquire()
+            response = self._session.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+                break
+            time.sleep(_retry_after_seconds(response.headers, attempt))
         return response
     
+    def invalidate(self, endpoint: str = None):
+        """Drop cached responses for this server, optionally only those under an endpoint prefix"""
+        with _response_cache_lock:
+            for cache in (_response_cache, _etag_cache):
+                for key in list(cache.keys()):
+                    if key[0] == self.base_url and (endpoint is None or key[2].startswith(endpoint)):
+                        cache.pop(key, None)
+    
+    def invalidate_caches(self):
+        """Flush every cache (responses, users) held for this server"""
+        self.invalidate()
+        with _user_cache_lock:
+            for key in list(_user_cache.keys()):
+                if key[0] == self.base_url:
+                    _user_cache.pop(key, None)
+    
+    @staticmethod
+    def cache_stats() -> Dict[str, int]:
+        """Get hit/miss counters and current size of the response cache"""
+        with _response_cache_lock:
+            return {**_response_cache_stats, 'size': len(_response_cache)}
+    
     def test_connection(self) -> MCPResponse:
         """Test connection to JIRA"""
         try:
             response = self._make_request('GET', 'myself')
             if response.status_code == 200:
-                user_data = response.json()
+                user_data = orjson.loads(response.content)
                 return MCPResponse(success=True, data={
                     "message": "Connection successful",
                     "user": user_data.get('displayName')
@@ -57,19 +496,7 @@ class JiraProvider(BaseMCPProvider):
             response = self._make_request('GET', 'project')
             
             if response.status_code == 200:
-                projects_data = response.json()
-                projects = []
-                
-                for project in projects_data:
-                    projects.append({
-                        'id': project['id'],
-                        'key': project['key'],
-                        'name': project['name'],
-                        'description': project.get('description', ''),
-                        'lead': project.get('lead', {}).get('displayName'),
-                        'projectTypeKey': project.get('projectTypeKey'),
-                        'url': project.get('self')
-                    })
+                projects = [_parse_project(project) for project in orjson.loads(response.content)]
                 
                 return MCPResponse(success=True, data=projects)
             else:
@@ -79,145 +506,125 @@ class JiraProvider(BaseMCPProvider):
             return MCPResponse(success=False, error=str(e))
     
     def get_work_items(self, project_id: str, **filters) -> MCPResponse:
-        """Get issues from JIRA project"""
+        """Get issues from JIRA project.
+        
+        All matching issues are fetched unless max_results is given; batch_size
+        sets the page size (default 100) for the concurrent startAt fan-out.
+        fields narrows the issue fields requested (default _SEARCH_FIELDS).
+        """
         try:
-            # Build JQL query based on filters
-            jql_parts = [f'project = "{project_id}"']
-            
-            if filters.get('status'):
-                jql_parts.append(f'status = "{filters["status"]}"')
+            params = _build_search_params(project_id, filters)
             
-            if filters.get('assignee'):
-                jql_parts.append(f'assignee = "{filters["assignee"]}"')
-            
-            if filters.get('issue_type'):
-                jql_parts.append(f'issuetype = "{filters["issue_type"]}"')
+            response = self._make_request('GET', 'search', params=params)
             
-            if filters.get('sprint'):
-                jql_parts.append(f'sprint = "{filters["sprint"]}"')
+            if response.status_code != 200:
+                return MCPResponse(success=False, error=f"Failed to get issues: {response.status_code}")
             
-            jql = ' AND '.join(jql_parts)
+            data = orjson.loads(response.content)
+            issues = data.get('issues', [])
             
-            params = {
-                'jql': jql,
-                'fields': 'summary,description,status,assignee,labels,created,updated,priority,customfield_10016',  # customfield_10016 is usually story points
-                'maxResults': filters.get('max_results', 100)
-            }
+            # Fetch any remaining pages concurrently once the total is known
+            offsets = _search_page_offsets(data, filters)
+            if offsets:
+                with ThreadPoolExecutor(max_workers=self.config.get('async_workers', 5)) as executor:
+                    pages = list(executor.map(
+                        lambda offset: self._make_request('GET', 'search', params={**params, 'startAt': offset}),
+                        offsets
+                    ))
+                for page in pages:
+                    if page.status_code != 200:
+                        return MCPResponse(success=False, error=f"Failed to get issues: {page.status_code}")
+                    issues.extend(orjson.loads(page.content).get('issues', []))
             
-            response = self._make_request('GET', 'search', params=params)
+            if filters.get('max_results'):
+                issues = issues[:filters['max_results']]
             
-            if response.status_code == 200:
-                data = response.json()
-                work_items = []
-                
-                for issue in data.get('issues', []):
-                    fields = issue.get('fields', {})
-                    
-                    work_item = WorkItem(
-                        id=issue['key'],
-                        title=fields.get('summary', ''),
-                        description=fields.get('description', {}).get('content', [{}])[0].get('content', [{}])[0].get('text', '') if fields.get('description') else '',
-                        status=fields.get('status', {}).get('name', ''),
-                        assignee=fields.get('assignee', {}).get('displayName') if fields.get('assignee') else None,
-                        labels=fields.get('labels', []),
-                        created_date=datetime.fromisoformat(fields.get('created', '').replace('Z', '+00:00')) if fields.get('created') else None,
-                        updated_date=datetime.fromisoformat(fields.get('updated', '').replace('Z', '+00:00')) if fields.get('updated') else None,
-                        priority=fields.get('priority', {}).get('name') if fields.get('priority') else None,
-                        story_points=fields.get('customfield_10016'),  # Story points custom field
-                        metadata={
-                            'issue_type': fields.get('issuetype', {}).get('name'),
-                            'project_key': issue['key'].split('-')[0],
-                            'url': f"{self.base_url}/browse/{issue['key']}"
-                        }
-                    )
-                    work_items.append(work_item)
-                
-                return MCPResponse(success=True, data=work_items)
-            else:
-                return MCPResponse(success=False, error=f"Failed to get issues: {response.status_code}")
+            work_items = [_parse_issue(issue, self.base_url) for issue in issues]
+            return MCPResponse(success=True, data=work_items)
         
         except Exception as e:
             return MCPResponse(success=False, error=str(e))
     
+    def iter_work_items(self, project_id: str, **filters) -> Iterator[WorkItem]:
+        """Yield issues page by page from the cursor-based search/jql endpoint.
+        
+        Takes the same filters as get_work_items, letting callers start on the
+        first page before the rest arrive. Raises RuntimeError if a page fails.
+        """
+        params = _build_search_params(project_id, filters)
+        remaining = filters.get('max_results')
+        
+        while True:
+            response = self._make_request('GET', 'search/jql', params=params)
+            if response.status_code != 200:
+                raise RuntimeError(f"Failed to get issues: {response.status_code}")
+            
+            data = orjson.loads(response.content)
+            issues = data.get('issues', [])
+            if remaining:
+                issues = issues[:remaining]
+                remaining -= len(issues)
+            yield from (_parse_issue(issue, self.base_url) for issue in issues)
+            
+            token = data.get('nextPageToken')
+            if not token or data.get('isLast') or remaining == 0:
+                break
+            params = {**params, 'nextPageToken': token}
+    
     def create_work_item(self, project_id: str, work_item: WorkItem) -> MCPResponse:
         """Create a new issue in JIRA"""
+        response = self.create_work_items_bulk(project_id, [work_item])
+        if not response.data:
+            return response
+        
+        result = response.data[0]
+        if 'error' in result:
+            return MCPResponse(success=False, error=result['error'])
+        return MCPResponse(success=True, data=result)
+    
+    def create_work_items_bulk(self, project_id: str, items: List[WorkItem]) -> MCPResponse:
+        """Create issues via POST issue/bulk, 50 per request.
+        
+        data holds one entry per input item, in order: {key, id, url} on
+        success or {error} for elements JIRA rejected.
+        """
         try:
-            # Default issue type if not specified
-            issue_type = work_item.metadata.get('issue_type', 'Story') if work_item.metadata else 'Story'
-            
-            # Basic required fields
-            issue_data = {
-                "fields": {
-                    "project": {"key": project_id},
-                    "summary": work_item.title,
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": work_item.description
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    "issuetype": {"name": issue_type}
-                }
-            }
-            
-            # Optional fields - only add if they exist and are supported
-            # Skip priority field as it's not available in this JIRA configuration
-            # if work_item.priority:
-            #     issue_data["fields"]["priority"] = {"name": work_item.priority}
-            
-            # Add assignee if specified (but handle potential errors)
-            if work_item.assignee:
-                try:
-                    issue_data["fields"]["assignee"] = {"displayName": work_item.assignee}
-                except:
-                    pass  # Skip if assignee field is not available
-            
-            # Add labels if specified
-            if work_item.labels:
+            results = []
+            for payload in _bulk_create_chunks(project_id, items):
+                response = self._make_request('POST', 'issue/bulk', data=orjson.dumps(payload))
                 try:
-                    issue_data["fields"]["labels"] = work_item.labels  # JIRA expects array of strings
-                except:
-                    pass  # Skip if labels field is not available
-            
-            # Add story points if specified (common custom field ID)
-            if work_item.story_points:
-                try:
-                    issue_data["fields"]["customfield_10016"] = work_item.story_points
-                except:
-                    pass  # Skip if story points field is not available
-            
-            response = self._make_request('POST', 'issue', json=issue_data)
+                    body = orjson.loads(response.content) if response.content else None
+                except orjson.JSONDecodeError:
+                    body = None
+                results.extend(_bulk_create_results(response.status_code, body, len(payload['issueUpdates']),
+                                                    self.base_url, response.text))
             
-            if response.status_code == 201:
-                created_issue = response.json()
-                return MCPResponse(success=True, data={
-                    'key': created_issue['key'],
-                    'id': created_issue['id'],
-                    'url': f"{self.base_url}/browse/{created_issue['key']}"
-                })
-            else:
-                return MCPResponse(success=False, error=f"Failed to create issue: {response.status_code} - {response.text}")
+            failed = [result['error'] for result in results if 'error' in result]
+            return MCPResponse(success=not failed, data=results, error='; '.join(failed) if failed else None)
         
         except Exception as e:
             return MCPResponse(success=False, error=str(e))
     
     def _find_user_by_name(self, display_name: str) -> str:
-        """Find user account ID by display name or email"""
+        """Find user account ID by display name or email, cached per server"""
+        key = (self.base_url, display_name.lower())
+        with _user_cache_lock:
+            account_id = _user_cache.get(key)
+        if account_id is None:
+            account_id = self._search_user(display_name)
+            if account_id:
+                with _user_cache_lock:
+                    _user_cache[key] = account_id
+        return account_id
+    
+    def _search_user(self, display_name: str) -> str:
+        """Look up a user's account ID through user/search"""
         try:
             # Try to search for user by display name
             response = self._make_request('GET', 'user/search', params={'query': display_name})
             
             if response.status_code == 200:
-                users = response.json()
+                users = orjson.loads(response.content)
                 if users:
                     # Return the first matching user's accountId
                     return users[0].get('accountId')
@@ -229,7 +636,7 @@ class JiraProvider(BaseMCPProvider):
                 response = self._make_request('GET', 'user/search', params={'query': email_query})
                 
                 if response.status_code == 200:
-                    users = response.json()
+                    users = orjson.loads(response.content)
                     if users:
                         return users[0].get('accountId')
             
@@ -244,35 +651,12 @@ class JiraProvider(BaseMCPProvider):
         try:
             update_data = {"fields": {}}
             
-            field_mapping = {
-                'title': 'summary',
-                'description': 'description',
-                'assignee': 'assignee',
-                'priority': 'priority',
-                'labels': 'labels',
-                'story_points': 'customfield_10016'
-            }
-            
             for key, value in updates.items():
-                if key in field_mapping:
-                    jira_field = field_mapping[key]
+                if key in _FIELD_MAPPING:
+                    jira_field = _FIELD_MAPPING[key]
                     
                     if key == 'description':
-                        update_data["fields"][jira_field] = {
-                            "type": "doc",
-                            "version": 1,
-                            "content": [
-                                {
-                                    "type": "paragraph",
-                                    "content": [
-                                        {
-                                            "type": "text",
-                                            "text": value
-                                        }
-                                    ]
-                                }
-                            ]
-                        }
+                        update_data["fields"][jira_field] = _adf_doc(value)
                     elif key == 'assignee':
                         # Find the user's account ID for proper assignment
                         account_id = self._find_user_by_name(value)
@@ -292,44 +676,16 @@ class JiraProvider(BaseMCPProvider):
                     else:
                         update_data["fields"][jira_field] = value
             
-            # Handle status separately with transition
+            # Handle status separately with transition, before the field PUT so
+            # fields that only exist on the target screen can be set
             if 'status' in updates:
-                # First, get available transitions
-                transitions_response = self._make_request('GET', f'issue/{work_item_id}/transitions')
-                
-                if transitions_response.status_code == 200:
-                    transitions = transitions_response.json().get('transitions', [])
-                    target_transition = None
-                    
-                    for transition in transitions:
-                        if transition['to']['name'].lower() == updates['status'].lower():
-                            target_transition = transition
-                            break
-                    
-                    if target_transition:
-                        transition_data = {
-                            "transition": {"id": target_transition['id']}
-                        }
-                        self._make_request('POST', f'issue/{work_item_id}/transitions', json=transition_data)
+                transition = self._transition_status(work_item_id, updates['status'])
+                if not transition.success:
+                    return transition
             
             # Update other fields
             if update_data["fields"]:
-                if current_app:
-                    current_app.logger.debug(f"Updating JIRA issue {work_item_id} with data: {update_data}")
-                response = self._make_request('PUT', f'issue/{work_item_id}', json=update_data)
-                
-                if response.status_code == 204:
-                    return MCPResponse(success=True, data={
-                        'key': work_item_id,
-                        'url': f"{self.base_url}/browse/{work_item_id}"
-                    })
-                else:
-                    error_msg = f"Failed to update issue: {response.status_code}"
-                    if response.text:
-                        error_msg += f" - {response.text}"
-                    if current_app:
-                        current_app.logger.error(f"JIRA update failed: {error_msg}")
-                    return MCPResponse(success=False, error=error_msg)
+                return self._put_fields(work_item_id, update_data)
             
             return MCPResponse(success=True, data={
                 'key': work_item_id,
@@ -339,23 +695,50 @@ class JiraProvider(BaseMCPProvider):
         except Exception as e:
             return MCPResponse(success=False, error=str(e))
     
+    def _put_fields(self, work_item_id: str, update_data: Dict[str, Any]) -> MCPResponse:
+        """PUT field changes to an issue"""
+        if current_app:
+            current_app.logger.debug(f"Updating JIRA issue {work_item_id} with data: {update_data}")
+        response = self._make_request('PUT', f'issue/{work_item_id}', data=orjson.dumps(update_data))
+        
+        if response.status_code == 204:
+            return MCPResponse(success=True, data={
+                'key': work_item_id,
+                'url': f"{self.base_url}/browse/{work_item_id}"
+            })
+        
+        error_msg = f"Failed to update issue: {response.status_code}"
+        if response.text:
+            error_msg += f" - {response.text}"
+        if current_app:
+            current_app.logger.error(f"JIRA update failed: {error_msg}")
+        return MCPResponse(success=False, error=error_msg)
+    
+    def _transition_status(self, work_item_id: str, status: str) -> MCPResponse:
+        """Move an issue to status via the transitions available from its current state"""
+        response = self._make_request('GET', f'issue/{work_item_id}/transitions')
+        if response.status_code != 200:
+            return MCPResponse(success=False, error=f"Failed to get transitions: {response.status_code}")
+        
+        target = status.lower()
+        transition_id = next((t['id'] for t in orjson.loads(response.content).get('transitions', [])
+                              if t['to']['name'].lower() == target), None)
+        if transition_id is None:
+            return MCPResponse(success=False, error=f"No transition to status '{status}' is available for {work_item_id}")
+        return _transition_result(work_item_id, self._post_transition(work_item_id, transition_id))
+    
+    def _post_transition(self, work_item_id: str, transition_id: str) -> requests.Response:
+        transition_data = {"transition": {"id": transition_id}}
+        return self._make_request('POST', f'issue/{work_item_id}/transitions', data=orjson.dumps(transition_data))
+    
     def get_work_item_comments(self, project_id: str, work_item_id: str) -> MCPResponse:
         """Get comments for an issue"""
         try:
             response = self._make_request('GET', f'issue/{work_item_id}/comment')
             
             if response.status_code == 200:
-                data = response.json()
-                comments = []
-                
-                for comment in data.get('comments', []):
-                    comments.append({
-                        'id': comment['id'],
-                        'body': comment['body']['content'][0]['content'][0]['text'] if comment.get('body', {}).get('content') else '',
-                        'author': comment.get('author', {}).get('displayName'),
-                        'created': comment.get('created'),
-                        'updated': comment.get('updated')
-                    })
+                data = orjson.loads(response.content)
+                comments = [_parse_comment(comment) for comment in data.get('comments', [])]
                 
                 return MCPResponse(success=True, data=comments)
             else:
@@ -367,34 +750,39 @@ class JiraProvider(BaseMCPProvider):
     def get_sprints(self, project_id: str) -> MCPResponse:
         """Get sprints for a project"""
         try:
-            # First get boards for the project
-            boards_response = self._make_request('GET', f'../../rest/agile/1.0/board', 
-                                                params={'projectKeyOrId': project_id})
+            # First get boards for the project, asking for sprints inline
+            boards_response = self._make_request('GET', _AGILE_BOARD_ENDPOINT, 
+                                                params={'projectKeyOrId': project_id, 'expand': 'sprints'})
             
             if boards_response.status_code != 200:
                 return MCPResponse(success=False, error=f"Failed to get boards: {boards_response.status_code}")
             
-            boards_data = boards_response.json()
+            boards = orjson.loads(boards_response.content).get('values', [])
+            
+            # One round-trip is enough when the server honours the expansion
+            expanded_sprints = _expanded_board_sprints(boards)
+            if expanded_sprints is not None:
+                return MCPResponse(success=True, data=expanded_sprints)
+            
             all_sprints = []
+            if not boards:
+                return MCPResponse(success=True, data=all_sprints)
             
-            # Get sprints for each board
-            for board in boards_data.get('values', []):
-                board_id = board['id']
-                sprints_response = self._make_request('GET', f'../../rest/agile/1.0/board/{board_id}/sprint')
-                
+            # Get sprints for each board concurrently; the worker count stays
+            # small to avoid tripping JIRA's rate limits and never exceeds the
+            # board count or the connection pool
+            workers = min(self.config.get('async_workers', 5), len(boards), _POOL_MAXSIZE)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sprints_responses = list(executor.map(
+                    lambda board: self._make_request('GET', f'{_AGILE_BOARD_ENDPOINT}/{board["id"]}/sprint'),
+                    boards
+                ))
+            
+            for sprints_response in sprints_responses:
                 if sprints_response.status_code == 200:
-                    sprints_data = sprints_response.json()
+                    sprints_data = orjson.loads(sprints_response.content)
                     
-                    for sprint in sprints_data.get('values', []):
-                        sprint_obj = Sprint(
-                            id=str(sprint['id']),
-                            name=sprint['name'],
-                            state=sprint['state'],
-                            start_date=datetime.fromisoformat(sprint.get('startDate', '').replace('Z', '+00:00')) if sprint.get('startDate') else None,
-                            end_date=datetime.fromisoformat(sprint.get('endDate', '').replace('Z', '+00:00')) if sprint.get('endDate') else None,
-                            goal=sprint.get('goal')
-                        )
-                        all_sprints.append(sprint_obj)
+                    all_sprints.extend(_parse_sprint(sprint) for sprint in sprints_data.get('values', []))
             
             return MCPResponse(success=True, data=all_sprints)
         
@@ -405,13 +793,13 @@ class JiraProvider(BaseMCPProvider):
         """Create a new sprint"""
         try:
             # First get boards for the project
-            boards_response = self._make_request('GET', f'../../rest/agile/1.0/board', 
+            boards_response = self._make_request('GET', _AGILE_BOARD_ENDPOINT, 
                                                 params={'projectKeyOrId': project_id})
             
             if boards_response.status_code != 200:
                 return MCPResponse(success=False, error=f"Failed to get boards: {boards_response.status_code}")
             
-            boards_data = boards_response.json()
+            boards_data = orjson.loads(boards_response.content)
             if not boards_data.get('values'):
                 return MCPResponse(success=False, error="No boards found for project")
             
@@ -432,10 +820,12 @@ class JiraProvider(BaseMCPProvider):
             if sprint.goal:
                 sprint_data["goal"] = sprint.goal
             
-            response = self._make_request('POST', f'../../rest/agile/1.0/sprint', json=sprint_data)
+            response = self._make_request('POST', f'../../rest/agile/1.0/sprint', data=orjson.dumps(sprint_data))
             
             if response.status_code == 201:
-                created_sprint = response.json()
+                # Board sprint listings are cached; drop them so the new sprint shows up
+                self.invalidate(_AGILE_BOARD_ENDPOINT)
+                created_sprint = orjson.loads(response.content)
                 return MCPResponse(success=True, data={
                     'id': created_sprint['id'],
                     'name': created_sprint['name'],
@@ -458,4 +848,198 @@ class JiraProvider(BaseMCPProvider):
             else:
                 return MCPResponse(success=False, error=f"Failed to delete issue: {response.status_code}")
         except Exception as e:
-            return MCPResponse(success=False, error=str(e)) 
\ No newline at end of file
+            return MCPResponse(success=False, error=str(e)) 
+
+class AsyncJiraProvider:
+    """Asynchronous JIRA provider for fan-out heavy workloads.
+    
+    Mirrors the read operations and bulk issue creation of JiraProvider as
+    coroutines backed by a shared aiohttp session, so independent requests
+    (e.g. the per-board sprint lookups or bulk-create batches) overlap
+    instead of running back to back. JiraProvider remains the synchronous
+    entry point for existing callers.
+    """
+    
+    def __init__(self, server_url: str, username: str, api_token: str, config: Dict[str, Any] = None):
+        self.base_url = server_url
+        self.username = username
+        self.config = config or {}
+        
+        self._auth = aiohttp.BasicAuth(username, api_token)
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> 'AsyncJiraProvider':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the client session lazily, inside the running event loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.get('max_concurrent_requests', JIRA_MAX_CONCURRENT_REQUESTS)
+            )
+            self._session = aiohttp.ClientSession(auth=self._auth, headers=dict(_JSON_HEADERS), connector=connector)
+        return self._session
+    
+    async def close(self) -> None:
+        """Release the underlying connection pool"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    async def _make_request(self, method: str, endpoint: str, **kwargs):
+        """Make authenticated request to JIRA API, returning (status, parsed JSON body).
+        
+        Draws from the same per-server budgets as JiraProvider._send, and
+        backs off on 429 for writes. The body is None when empty or not JSON
+        (e.g. a proxy's HTML error page).
+        """
+        url = f"{self.base_url}/rest/api/3/{endpoint}"
+        session = await self._get_session()
+        budget = _request_limiter(self.base_url, self.username,
+                                  self.config.get('requests_per_minute', _REQUESTS_PER_MINUTE))
+        limiter = _write_limiter(self.base_url, self.config.get('write_requests_per_second', 10)) \
+            if method in _WRITE_METHODS else None
+        
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            await budget.acquire_async()
+            if limiter is not None:
+                await limiter.acquire_async()
+            async with session.request(method, url, **kwargs) as response:
+                body = await response.read()
+                if response.status != 429 or limiter is None or attempt == _MAX_RATE_LIMIT_RETRIES:
+                    break
+                delay = _retry_after_seconds(response.headers, attempt)
+            await asyncio.sleep(delay)
+        
+        try:
+            return response.status, (orjson.loads(body) if body else None)
+        except orjson.JSONDecodeError:
+            return response.status, None
+    
+    async def test_connection(self) -> MCPResponse:
+        """Test connection to JIRA"""
+        try:
+            status, user_data = await self._make_request('GET', 'myself')
+            if status == 200:
+                return MCPResponse(success=True, data={
+                    "message": "Connection successful",
+                    "user": user_data.get('displayName')
+                })
+            else:
+                return MCPResponse(success=False, error=f"Connection failed: {status}")
+        except Exception as e:
+            return MCPResponse(success=False, error=str(e))
+    
+    async def get_projects(self) -> MCPResponse:
+        """Get list of JIRA projects"""
+        try:
+            status, projects_data = await self._make_request('GET', 'project')
+            
+            if status == 200:
+                return MCPResponse(success=True, data=[_parse_project(project) for project in projects_data])
+            else:
+                return MCPResponse(success=False, error=f"Failed to get projects: {status}")
+        
+        except Exception as e:
+            return MCPResponse(success=False, error=str(e))
+    
+    async def get_work_items(self, project_id: str, **filters) -> MCPResponse:
+        """Get issues from JIRA project"""
+        try:
+            params = _build_search_params(project_id, filters)
+            status, data = await self._make_request('GET', 'search', params=params)
+            
+            if status != 200:
+                return MCPResponse(success=False, error=f"Failed to get issues: {status}")
+            
+            issues = data.get('issues', [])
+            pages = await asyncio.gather(*[
+                self._make_request('GET', 'search', params={**params, 'startAt': offset})
+                for offset in _search_page_offsets(data, filters)
+            ])
+            for page_status, page_data in pages:
+                if page_status != 200:
+                    return MCPResponse(success=False, error=f"Failed to get issues: {page_status}")
+                issues.extend(page_data.get('issues', []))
+            
+            if filters.get('max_results'):
+                issues = issues[:filters['max_results']]
+            
+            work_items = [_parse_issue(issue, self.base_url) for issue in issues]
+            return MCPResponse(success=True, data=work_items)
+        
+        except Exception as e:
+            return MCPResponse(success=False, error=str(e))
+    
+    async def get_work_item_comments(self, project_id: str, work_item_id: str) -> MCPResponse:
+        """Get comments for an issue"""
+        try:
+            status, data = await self._make_request('GET', f'issue/{work_item_id}/comment')
+            
+            if status == 200:
+                return MCPResponse(success=True, data=[_parse_comment(comment) for comment in data.get('comments', [])])
+            else:
+                return MCPResponse(success=False, error=f"Failed to get comments: {status}")
+        
+        except Exception as e:
+            return MCPResponse(success=False, error=str(e))
+    
+    async def get_sprints(self, project_id: str) -> MCPResponse:
+        """Get sprints for a project, fetching every board's sprints concurrently"""
+        try:
+            status, boards_data = await self._make_request('GET', _AGILE_BOARD_ENDPOINT,
+                                                           params={'projectKeyOrId': project_id, 'expand': 'sprints'})
+            
+            if status != 200:
+                return MCPResponse(success=False, error=f"Failed to get boards: {status}")
+            
+            expanded_sprints = _expanded_board_sprints(boards_data.get('values', []))
+            if expanded_sprints is not None:
+                return MCPResponse(success=True, data=expanded_sprints)
+            
+            results = await asyncio.gather(*[
+                self._make_request('GET', f'{_AGILE_BOARD_ENDPOINT}/{board["id"]}/sprint')
+                for board in boards_data.get('values', [])
+            ], return_exceptions=True)
+            
+            # Like the sync provider, boards that fail are skipped rather than failing the call
+            all_sprints = []
+            for result in results:
+                if isinstance(result, Exception):
+                    continue
+                sprints_status, sprints_data = result
+                if sprints_status == 200 and sprints_data:
+                    all_sprints.extend(_parse_sprint(sprint) for sprint in sprints_data.get('values', []))
+            
+            return MCPResponse(success=True, data=all_sprints)
+        
+        except Exception as e:
+            return MCPResponse(success=False, error=str(e))
+    
+    async def create_work_items_bulk(self, project_id: str, items: List[WorkItem]) -> MCPResponse:
+        """Create issues via POST issue/bulk, sending the 50-issue batches concurrently"""
+        try:
+            payloads = _bulk_create_chunks(project_id, items)
+            responses = await asyncio.gather(*[
+                self._make_request('POST', 'issue/bulk', data=orjson.dumps(payload))
+                for payload in payloads
+            ], return_exceptions=True)
+            
+            # A failed batch only marks its own elements, so keys created by
+            # the other batches are still reported to the caller
+            results = []
+            for payload, response in zip(payloads, responses):
+                count = len(payload['issueUpdates'])
+                if isinstance(response, Exception):
+                    results.extend({'error': f"Failed to create issue: {response}"} for _ in range(count))
+                    continue
+                status, body = response
+                results.extend(_bulk_create_results(status, body, count, self.base_url, body))
+            
+            failed = [result['error'] for result in results if 'error' in result]
+            return MCPResponse(success=not failed, data=results, error='; '.join(failed) if failed else None)
+        
+        except Exception as e:
+            return MCPResponse(success=False, error=str(e))
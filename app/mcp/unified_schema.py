@@ -2,8 +2,9 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 
-class EntityType(Enum):
+class EntityType(str, Enum):
     WORK_ITEM = "work_item"
     SPRINT = "sprint"
     USER = "user"
@@ -15,7 +16,10 @@ class EntityType(Enum):
     LABEL = "label"
     COMMENT = "comment"
 
-class WorkItemType(Enum):
+# Entity type -> string value, so hot paths skip the Enum .value descriptor
+ENTITY_VALUES = MappingProxyType({entity: entity.value for entity in EntityType})
+
+class WorkItemType(str, Enum):
     TASK = "task"
     STORY = "story"
     BUG = "bug"
@@ -24,20 +28,20 @@ class WorkItemType(Enum):
     ISSUE = "issue"
     PULL_REQUEST = "pull_request"
 
-class WorkItemStatus(Enum):
+class WorkItemStatus(str, Enum):
     TODO = "todo"
     IN_PROGRESS = "in_progress"
     DONE = "done"
     BLOCKED = "blocked"
     CANCELLED = "cancelled"
 
-class Priority(Enum):
+class Priority(str, Enum):
     CRITICAL = "critical"
     HIGH = "high"
     MEDIUM = "medium"
     LOW = "low"
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedUser:
     id: str
     name: str
@@ -48,7 +52,7 @@ class UnifiedUser:
     source_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedWorkItem:
     id: str
     title: str
@@ -72,7 +76,7 @@ class UnifiedWorkItem:
     attachments: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedSprint:
     id: str
     name: str
@@ -85,7 +89,7 @@ class UnifiedSprint:
     source_tool: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedRepository:
     id: str
     name: str
@@ -102,7 +106,7 @@ class UnifiedRepository:
     source_tool: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedPullRequest:
     id: str
     title: str
@@ -123,7 +127,7 @@ class UnifiedPullRequest:
     source_url: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedCommit:
     id: str
     sha: str
@@ -138,7 +142,7 @@ class UnifiedCommit:
     source_url: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedComment:
     id: str
     content: str
@@ -149,7 +153,7 @@ class UnifiedComment:
     source_tool: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedProject:
     id: str
     name: str
@@ -166,7 +170,7 @@ class UnifiedProject:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 # Query and response structures for unified operations
-@dataclass
+@dataclass(slots=True)
 class UnifiedQuery:
     """Represents a query that can be executed across multiple tools"""
     entities: List[EntityType]
@@ -177,7 +181,7 @@ class UnifiedQuery:
     sort_by: Optional[str] = None
     sort_order: Optional[str] = "asc"
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedResponse:
     """Unified response containing data from multiple tools"""
     success: bool
@@ -187,7 +191,7 @@ class UnifiedResponse:
     source_tools: List[str] = field(default_factory=list)
 
 # Tool capability definitions
-@dataclass
+@dataclass(slots=True)
 class ToolCapabilities:
     """Defines what capabilities a tool has"""
     tool_name: str
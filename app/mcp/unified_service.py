@@ -1,5 +1,13 @@
-from typing import Dict, Any, List, Optional, Set
+import asyncio
+import operator
+import threading
+from collections import defaultdict
+from typing import Dict, Any, Callable, List, Mapping, Optional, Set, Tuple
+from cachetools import LRUCache, TTLCache
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import wraps
+from types import MappingProxyType
 from flask import current_app
 
 from .unified_schema import (
@@ -13,6 +21,152 @@ from .jira import JiraProvider
 from .github import GitHubProvider
 from .azure_devops import AzureDevOpsProvider
 
+# Lowercased tool values -> unified enums
+_JIRA_TYPE_MAP = MappingProxyType({
+    'story': WorkItemType.STORY,
+    'task': WorkItemType.TASK,
+    'bug': WorkItemType.BUG,
+    'epic': WorkItemType.EPIC,
+    'feature': WorkItemType.FEATURE
+})
+_JIRA_STATUS_MAP = MappingProxyType({
+    'to do': WorkItemStatus.TODO,
+    'todo': WorkItemStatus.TODO,
+    'open': WorkItemStatus.TODO,
+    'in progress': WorkItemStatus.IN_PROGRESS,
+    'doing': WorkItemStatus.IN_PROGRESS,
+    'active': WorkItemStatus.IN_PROGRESS,
+    'done': WorkItemStatus.DONE,
+    'closed': WorkItemStatus.DONE,
+    'resolved': WorkItemStatus.DONE,
+    'blocked': WorkItemStatus.BLOCKED,
+    'cancelled': WorkItemStatus.CANCELLED
+})
+_JIRA_PRIORITY_MAP = MappingProxyType({
+    'highest': Priority.CRITICAL,
+    'high': Priority.HIGH,
+    'medium': Priority.MEDIUM,
+    'low': Priority.LOW,
+    'lowest': Priority.LOW
+})
+_GITHUB_STATUS_MAP = MappingProxyType({
+    'open': WorkItemStatus.TODO,
+    'closed': WorkItemStatus.DONE
+})
+_AZURE_TYPE_MAP = MappingProxyType({
+    'user story': WorkItemType.STORY,
+    'task': WorkItemType.TASK,
+    'bug': WorkItemType.BUG,
+    'epic': WorkItemType.EPIC,
+    'feature': WorkItemType.FEATURE
+})
+_AZURE_STATUS_MAP = MappingProxyType({
+    'new': WorkItemStatus.TODO,
+    'active': WorkItemStatus.IN_PROGRESS,
+    'resolved': WorkItemStatus.DONE,
+    'closed': WorkItemStatus.DONE,
+    'removed': WorkItemStatus.CANCELLED
+})
+
+def _map_value(mapping: Mapping[str, Any], value: Optional[str], default: Any) -> Any:
+    """Look value up in a lowercase-keyed map, trying it as-is before lowercasing"""
+    if not value:
+        return default
+    return mapping.get(value) or mapping.get(value.lower(), default)
+
+def _dedup_keys(entity) -> Tuple[tuple, Optional[tuple]]:
+    """Identities an entity is deduplicated on: its id within its source tool,
+    and title plus creation time (None if either is missing) to catch the same
+    item linked from another tool"""
+    title = getattr(entity, 'title', None)
+    created_date = getattr(entity, 'created_date', None)
+    title_key = (title, created_date) if title and created_date else None
+    return (entity.source_tool, entity.id), title_key
+
+_EMPTY_METADATA = MappingProxyType({})
+
+def _source_url(item) -> Optional[str]:
+    """Link back to the item in its source tool, from provider metadata"""
+    return (item.metadata or _EMPTY_METADATA).get('url')
+
+# Seconds a tool's converted entities are reused before the provider is asked
+# again: short for fast-moving code activity, longer for planning structures
+_ENTITY_CACHE_TTL = {
+    EntityType.WORK_ITEM: 60,
+    EntityType.SPRINT: 300,
+    EntityType.REPOSITORY: 300,
+    EntityType.PULL_REQUEST: 30,
+    EntityType.COMMIT: 30
+}
+# Unified sort fields each provider can order by natively. When the sort
+# field is listed (or there is no sort), the limit is applied at the source
+# without changing which items come back.
+_PUSHDOWN_ORDER_FIELDS = MappingProxyType({
+    'jira': MappingProxyType({
+        'created_date': 'created',
+        'updated_date': 'updated',
+        'title': 'summary'
+    }),
+    'azure_devops': MappingProxyType({
+        'created_date': '[System.CreatedDate]',
+        'updated_date': '[System.ChangedDate]',
+        'title': '[System.Title]'
+    })
+})
+
+_entity_caches = {entity_type: TTLCache(maxsize=1024, ttl=ttl) for entity_type, ttl in _ENTITY_CACHE_TTL.items()}
+_entity_cache_lock = threading.RLock()
+# Fetches currently running per cache key; concurrent misses for the same key
+# wait on the first one instead of each calling the provider
+_inflight_fetches: Dict[tuple, Future] = {}
+
+def _tool_scope(tool_config: Optional[Dict[str, Any]]) -> tuple:
+    """Identify the tool instance a fetch ran against, so tenants sharing a project key
+    or repository name on different sites never see each other's cached data"""
+    tool_config = tool_config or {}
+    return (tool_config.get('id'), tool_config.get('base_url'),
+            tool_config.get('repository_name'), tool_config.get('owner'),
+            repr(sorted((tool_config.get('configuration') or {}).items())))
+
+def _cached_fetch(entity_type: EntityType):
+    """Cache a _fetch_* method's non-empty results per (tool instance, project, filters, limit/sort),
+    collapsing concurrent identical fetches into one provider call"""
+    cache = _entity_caches[entity_type]
+    
+    def decorator(fetch: Callable) -> Callable:
+        @wraps(fetch)
+        def wrapper(self, tool_name: str, tool_config: Dict, project_key: str, query: UnifiedQuery) -> List:
+            key = (tool_name, _tool_scope(tool_config), project_key, repr(sorted(query.filters.items())),
+                   query.limit, query.sort_by, query.sort_order)
+            inflight_key = (entity_type, *key)
+            with _entity_cache_lock:
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+                pending = _inflight_fetches.get(inflight_key)
+                if pending is None:
+                    _inflight_fetches[inflight_key] = owned = Future()
+            if pending is not None:
+                return pending.result()
+            
+            try:
+                entities = fetch(self, tool_name, tool_config, project_key, query)
+            except Exception as e:
+                with _entity_cache_lock:
+                    _inflight_fetches.pop(inflight_key, None)
+                owned.set_exception(e)
+                raise
+            
+            with _entity_cache_lock:
+                # Empty results aren't cached: they are also what a failed fetch returns
+                if entities:
+                    cache[key] = entities
+                _inflight_fetches.pop(inflight_key, None)
+            owned.set_result(entities)
+            return entities
+        return wrapper
+    return decorator
+
 
 class UnifiedMCPService:
     """Unified service that can fetch data from multiple tools and return unified entities"""
@@ -20,11 +174,41 @@ class UnifiedMCPService:
     def __init__(self):
         self.providers = {}
         self.tool_capabilities = TOOL_CAPABILITIES
+        # Entity type -> tools supporting it, so relevance is a set lookup per entity
+        entity_to_tools: Dict[EntityType, Set[str]] = {}
+        for tool_name, capabilities in TOOL_CAPABILITIES.items():
+            for entity_type in capabilities.supported_entities:
+                entity_to_tools.setdefault(entity_type, set()).add(tool_name)
+        self._entity_to_tools = {entity_type: frozenset(tools) for entity_type, tools in entity_to_tools.items()}
+        # Relevant tools per (project tool types, registered providers, entities)
+        self._relevant_tools_cache = LRUCache(maxsize=256)
+        self._relevant_tools_lock = threading.Lock()
+        # Tools are queried concurrently; kept small to stay inside provider rate limits
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='mcp-fetch')
+        # Entity fetches within a tool get their own pool so tool tasks never
+        # wait on work queued behind themselves
+        self._entity_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='mcp-entity')
+        self._entity_fetchers = {
+            EntityType.WORK_ITEM: self._fetch_work_items,
+            EntityType.SPRINT: self._fetch_sprints,
+            EntityType.USER: self._fetch_users,
+            EntityType.REPOSITORY: self._fetch_repositories,
+            EntityType.PULL_REQUEST: self._fetch_pull_requests,
+            EntityType.COMMIT: self._fetch_commits
+        }
     
     def register_provider(self, tool_type: str, provider):
         """Register a tool provider"""
         self.providers[tool_type] = provider
     
+    def invalidate_cache(self, tool_name: str = None):
+        """Drop cached entities, optionally only those fetched from one tool"""
+        with _entity_cache_lock:
+            for cache in _entity_caches.values():
+                for key in list(cache.keys()):
+                    if tool_name is None or key[0] == tool_name:
+                        cache.pop(key, None)
+    
     def get_available_tools(self, project_context: Dict[str, Any]) -> List[str]:
         """Get list of available tools for the project"""
         available_tools = []
@@ -36,30 +220,19 @@ class UnifiedMCPService:
     
     def determine_relevant_tools(self, query: UnifiedQuery, available_tools: List[str]) -> List[str]:
         """Determine which tools are relevant for the given query"""
-        relevant_tools = []
-        
-        for tool_name in available_tools:
-            if tool_name in self.tool_capabilities:
-                capabilities = self.tool_capabilities[tool_name]
-                
-                # Check if the tool supports any of the requested entities
-                for entity_type in query.entities:
-                    if entity_type in capabilities.supported_entities:
-                        if tool_name not in relevant_tools:
-                            relevant_tools.append(tool_name)
-                        break
+        supporting = set()
+        for entity_type in query.entities:
+            supporting |= self._entity_to_tools.get(entity_type, frozenset())
         
-        return relevant_tools
+        # Keep the project's tool order, listing each tool once
+        return list(dict.fromkeys(tool_name for tool_name in available_tools if tool_name in supporting))
     
     def execute_unified_query(self, query: UnifiedQuery, project_context: Dict[str, Any]) -> UnifiedResponse:
         """Execute a unified query across multiple tools"""
         response = UnifiedResponse(success=True)
         
-        # Get available tools for this project
-        available_tools = self.get_available_tools(project_context)
-        
-        # Determine which tools are relevant for this query
-        relevant_tools = self.determine_relevant_tools(query, available_tools)
+        # Determine which of the project's available tools are relevant for this query
+        relevant_tools = self._relevant_tools(query, project_context)
         
         if not relevant_tools:
             response.success = False
@@ -72,68 +245,149 @@ class UnifiedMCPService:
         for entity_type in query.entities:
             response.data[entity_type] = []
         
-        # Fetch data from each relevant tool
-        for tool_name in relevant_tools:
+        # Index tool configs by type once; the first config of a type wins
+        tools_by_type = {}
+        for tool in project_context.get('tools', []):
+            tools_by_type.setdefault(tool.get('type'), tool)
+        
+        # Fetch data from all relevant tools concurrently, merging in tool order
+        app = current_app._get_current_object()
+        futures = [
+            (tool_name, self._executor.submit(self._in_app_context, app, self._fetch_from_tool,
+                                              tool_name, query, project_context, tools_by_type.get(tool_name)))
+            for tool_name in relevant_tools
+        ]
+        cap = self._conversion_cap(query)
+        seen_ids: Dict[EntityType, Set[tuple]] = defaultdict(set)
+        # Title keys of earlier tools only: two items from one tool that share
+        # a title and creation time (e.g. a bulk create) are still distinct
+        seen_titles: Dict[EntityType, Set[tuple]] = defaultdict(set)
+        for index, (tool_name, future) in enumerate(futures):
             try:
-                tool_data = self._fetch_from_tool(tool_name, query, project_context)
+                tool_data = future.result()
                 
-                # Merge data into response
+                # Merge data into response, skipping entities already seen
                 for entity_type, entities in tool_data.items():
                     if entity_type in response.data:
-                        response.data[entity_type].extend(entities)
+                        merged = response.data[entity_type]
+                        ids, earlier_titles = seen_ids[entity_type], seen_titles[entity_type]
+                        tool_titles = set()
+                        for entity in entities:
+                            id_key, title_key = _dedup_keys(entity)
+                            if id_key in ids or title_key in earlier_titles:
+                                continue
+                            ids.add(id_key)
+                            if title_key:
+                                tool_titles.add(title_key)
+                            merged.append(entity)
+                        earlier_titles |= tool_titles
                 
             except Exception as e:
                 error_msg = f"Error fetching from {tool_name}: {str(e)}"
                 response.errors.append(error_msg)
                 current_app.logger.error(error_msg)
+            
+            # Unsorted results are limited in tool order, so once every entity
+            # type is full the remaining tools' items would all be cut
+            if cap and all(len(entities) >= cap for entities in response.data.values()):
+                for _, pending in futures[index + 1:]:
+                    pending.cancel()
+                break
         
         # Apply post-processing (deduplication, sorting, filtering)
         response = self._post_process_response(response, query)
         
         return response
     
-    def _fetch_from_tool(self, tool_name: str, query: UnifiedQuery, project_context: Dict[str, Any]) -> Dict[EntityType, List]:
-        """Fetch data from a specific tool and convert to unified format"""
-        tool_data = {}
-        
-        # Find the tool configuration
-        tool_config = None
-        for tool in project_context.get('tools', []):
-            if tool.get('type') == tool_name:
-                tool_config = tool
-                break
+    def _relevant_tools(self, query: UnifiedQuery, project_context: Dict[str, Any]) -> List[str]:
+        """determine_relevant_tools over the available tools, memoized on everything the answer depends on"""
+        key = (
+            tuple(tool.get('type') for tool in project_context.get('tools', [])),
+            frozenset(self.providers),
+            frozenset(query.entities)
+        )
+        with self._relevant_tools_lock:
+            relevant_tools = self._relevant_tools_cache.get(key)
+        if relevant_tools is None:
+            relevant_tools = tuple(self.determine_relevant_tools(query, self.get_available_tools(project_context)))
+            with self._relevant_tools_lock:
+                self._relevant_tools_cache[key] = relevant_tools
+        return list(relevant_tools)
+    
+    async def execute_unified_query_async(self, query: UnifiedQuery, project_context: Dict[str, Any]) -> UnifiedResponse:
+        """Awaitable execute_unified_query for async callers.
         
+        The query runs on the event loop's default executor with the Flask app
+        context preserved, so the loop is never blocked on provider I/O.
+        """
+        app = current_app._get_current_object()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._in_app_context, app, self.execute_unified_query,
+                                          query, project_context)
+    
+    @staticmethod
+    def _conversion_cap(query: UnifiedQuery) -> Optional[int]:
+        """Items per tool and entity type worth converting: the limit, unless
+        a sort means any fetched item could end up in the top results"""
+        return query.limit if query.limit and not query.sort_by else None
+    
+    def _capped(self, items: List, query: UnifiedQuery) -> List:
+        """Provider items trimmed to what the query can return before conversion"""
+        cap = self._conversion_cap(query)
+        return items[:cap] if cap else items
+    
+    @staticmethod
+    def _in_app_context(app, fn: Callable, *args):
+        """Run fn inside app's context so worker threads can use current_app"""
+        with app.app_context():
+            return fn(*args)
+    
+    def _fetch_from_tool(self, tool_name: str, query: UnifiedQuery, project_context: Dict[str, Any],
+                         tool_config: Optional[Dict[str, Any]]) -> Dict[EntityType, List]:
+        """Fetch data from a specific tool and convert to unified format"""
         if not tool_config:
-            return tool_data
+            return {}
         
         project_key = project_context['project']['key']
         
-        # Fetch data based on entity types requested
-        for entity_type in query.entities:
-            entities = []
-            
+        # Fetch the requested entity types concurrently; types this service
+        # can't fetch stay empty
+        tool_data = {entity_type: [] for entity_type in query.entities}
+        app = current_app._get_current_object()
+        futures = [
+            (entity_type, self._entity_executor.submit(self._in_app_context, app, self._entity_fetchers[entity_type],
+                                                       tool_name, tool_config, project_key, query))
+            for entity_type in query.entities if entity_type in self._entity_fetchers
+        ]
+        for entity_type, future in futures:
             try:
-                if entity_type == EntityType.WORK_ITEM:
-                    entities = self._fetch_work_items(tool_name, tool_config, project_key, query)
-                elif entity_type == EntityType.SPRINT:
-                    entities = self._fetch_sprints(tool_name, tool_config, project_key, query)
-                elif entity_type == EntityType.USER:
-                    entities = self._fetch_users(tool_name, tool_config, project_key, query)
-                elif entity_type == EntityType.REPOSITORY:
-                    entities = self._fetch_repositories(tool_name, tool_config, project_key, query)
-                elif entity_type == EntityType.PULL_REQUEST:
-                    entities = self._fetch_pull_requests(tool_name, tool_config, project_key, query)
-                elif entity_type == EntityType.COMMIT:
-                    entities = self._fetch_commits(tool_name, tool_config, project_key, query)
-                
-                tool_data[entity_type] = entities
-                
+                tool_data[entity_type] = future.result()
             except Exception as e:
                 current_app.logger.error(f"Error fetching {entity_type.value} from {tool_name}: {str(e)}")
                 tool_data[entity_type] = []
         
         return tool_data
     
+    def _translate_filters(self, tool_name: str, query: UnifiedQuery) -> Dict[str, Any]:
+        """Provider filters for query, pushing sort and limit down where the tool supports it"""
+        filters = dict(query.filters)
+        order_fields = _PUSHDOWN_ORDER_FIELDS.get(tool_name)
+        if order_fields is None:
+            return filters
+        
+        if query.sort_by:
+            order_field = order_fields.get(query.sort_by)
+            if order_field is None:
+                # Can't order at the source, so the limit has to wait for the merge
+                return filters
+            direction = 'DESC' if (query.sort_order or '').lower() == 'desc' else 'ASC'
+            filters['order_by'] = f"{order_field} {direction}"
+        
+        if query.limit:
+            filters['max_results'] = min(query.limit, filters.get('max_results') or query.limit)
+        return filters
+    
+    @_cached_fetch(EntityType.WORK_ITEM)
     def _fetch_work_items(self, tool_name: str, tool_config: Dict, project_key: str, query: UnifiedQuery) -> List[UnifiedWorkItem]:
         """Fetch work items from a tool and convert to unified format"""
         unified_items = []
@@ -141,13 +395,10 @@ class UnifiedMCPService:
         if tool_name == "jira":
             provider = self.providers.get("jira")
             if provider:
-                response = provider.get_work_items(project_key, **query.filters)
+                response = provider.get_work_items(project_key, **self._translate_filters(tool_name, query))
                 if response.success:
-                    for item in response.data:
-                        unified_item = self._convert_jira_work_item(item)
-                        unified_items.append(unified_item)
-                        # Add logging to track each item
-                        current_app.logger.debug(f"Fetched JIRA work item: {unified_item.id} - {unified_item.title}")
+                    convert = self._convert_jira_work_item
+                    unified_items = [convert(item) for item in self._capped(response.data, query)]
         
         elif tool_name == "github":
             provider = self.providers.get("github")
@@ -157,25 +408,21 @@ class UnifiedMCPService:
                 if repo_name:
                     response = provider.get_work_items(repo_name, **query.filters)
                     if response.success:
-                        for item in response.data:
-                            unified_item = self._convert_github_work_item(item)
-                            unified_items.append(unified_item)
-                            # Add logging to track each item
-                            current_app.logger.debug(f"Fetched GitHub work item: {unified_item.id} - {unified_item.title}")
+                        convert = self._convert_github_work_item
+                        unified_items = [convert(item) for item in self._capped(response.data, query)]
         
         elif tool_name == "azure_devops":
             provider = self.providers.get("azure_devops")
             if provider:
-                response = provider.get_work_items(project_key, **query.filters)
+                response = provider.get_work_items(project_key, **self._translate_filters(tool_name, query))
                 if response.success:
-                    for item in response.data:
-                        unified_item = self._convert_azure_work_item(item)
-                        unified_items.append(unified_item)
-                        # Add logging to track each item
-                        current_app.logger.debug(f"Fetched Azure DevOps work item: {unified_item.id} - {unified_item.title}")
+                    convert = self._convert_azure_work_item
+                    unified_items = [convert(item) for item in self._capped(response.data, query)]
         
+        current_app.logger.debug("Fetched %d %s work items", len(unified_items), tool_name)
         return unified_items
     
+    @_cached_fetch(EntityType.SPRINT)
     def _fetch_sprints(self, tool_name: str, tool_config: Dict, project_key: str, query: UnifiedQuery) -> List[UnifiedSprint]:
         """Fetch sprints from a tool and convert to unified format"""
         unified_sprints = []
@@ -185,14 +432,12 @@ class UnifiedMCPService:
             if provider:
                 response = provider.get_sprints(project_key, **query.filters)
                 if response.success:
-                    for sprint in response.data:
-                        if tool_name == "jira":
-                            unified_sprints.append(self._convert_jira_sprint(sprint))
-                        else:
-                            unified_sprints.append(self._convert_azure_sprint(sprint))
+                    convert = self._convert_jira_sprint if tool_name == "jira" else self._convert_azure_sprint
+                    unified_sprints = [convert(sprint) for sprint in self._capped(response.data, query)]
         
         return unified_sprints
     
+    @_cached_fetch(EntityType.REPOSITORY)
     def _fetch_repositories(self, tool_name: str, tool_config: Dict, project_key: str, query: UnifiedQuery) -> List[UnifiedRepository]:
         """Fetch repositories from a tool and convert to unified format"""
         unified_repos = []
@@ -205,11 +450,12 @@ class UnifiedMCPService:
                 if owner:
                     response = provider.get_repositories(owner, **query.filters)
                     if response.success:
-                        for repo in response.data:
-                            unified_repos.append(self._convert_github_repository(repo))
+                        convert = self._convert_github_repository
+                        unified_repos = [convert(repo) for repo in self._capped(response.data, query)]
         
         return unified_repos
     
+    @_cached_fetch(EntityType.PULL_REQUEST)
     def _fetch_pull_requests(self, tool_name: str, tool_config: Dict, project_key: str, query: UnifiedQuery) -> List[UnifiedPullRequest]:
         """Fetch pull requests from a tool and convert to unified format"""
         unified_prs = []
@@ -221,11 +467,12 @@ class UnifiedMCPService:
                 if repo_name:
                     response = provider.get_pull_requests(repo_name, **query.filters)
                     if response.success:
-                        for pr in response.data:
-                            unified_prs.append(self._convert_github_pull_request(pr))
+                        convert = self._convert_github_pull_request
+                        unified_prs = [convert(pr) for pr in self._capped(response.data, query)]
         
         return unified_prs
     
+    @_cached_fetch(EntityType.COMMIT)
     def _fetch_commits(self, tool_name: str, tool_config: Dict, project_key: str, query: UnifiedQuery) -> List[UnifiedCommit]:
         """Fetch commits from a tool and convert to unified format"""
         unified_commits = []
@@ -237,8 +484,8 @@ class UnifiedMCPService:
                 if repo_name:
                     response = provider.get_commits(repo_name, **query.filters)
                     if response.success:
-                        for commit in response.data:
-                            unified_commits.append(self._convert_github_commit(commit))
+                        convert = self._convert_github_commit
+                        unified_commits = [convert(commit) for commit in self._capped(response.data, query)]
         
         return unified_commits
     
@@ -263,7 +510,7 @@ class UnifiedMCPService:
             created_date=item.created_date,
             updated_date=item.updated_date,
             source_tool="jira",
-            source_url=item.metadata.get('url') if item.metadata else None,
+            source_url=_source_url(item),
             metadata=item.metadata or {}
         )
     
@@ -280,7 +527,7 @@ class UnifiedMCPService:
             created_date=item.created_date,
             updated_date=item.updated_date,
             source_tool="github",
-            source_url=item.metadata.get('url') if item.metadata else None,
+            source_url=_source_url(item),
             metadata=item.metadata or {}
         )
     
@@ -352,7 +599,7 @@ class UnifiedMCPService:
             created_date=pr.created_date,
             updated_date=pr.updated_date,
             source_tool="github",
-            source_url=pr.metadata.get('url') if pr.metadata else None,
+            source_url=_source_url(pr),
             metadata=pr.metadata or {}
         )
     
@@ -371,96 +618,50 @@ class UnifiedMCPService:
     # Status and type mapping methods
     def _map_jira_type_to_unified(self, jira_type: str) -> WorkItemType:
         """Map JIRA issue type to unified work item type"""
-        mapping = {
-            'story': WorkItemType.STORY,
-            'task': WorkItemType.TASK,
-            'bug': WorkItemType.BUG,
-            'epic': WorkItemType.EPIC,
-            'feature': WorkItemType.FEATURE
-        }
-        return mapping.get(jira_type.lower(), WorkItemType.TASK)
+        return _map_value(_JIRA_TYPE_MAP, jira_type, WorkItemType.TASK)
     
     def _map_jira_status_to_unified(self, jira_status: str) -> WorkItemStatus:
         """Map JIRA status to unified work item status"""
-        mapping = {
-            'to do': WorkItemStatus.TODO,
-            'todo': WorkItemStatus.TODO,
-            'open': WorkItemStatus.TODO,
-            'in progress': WorkItemStatus.IN_PROGRESS,
-            'doing': WorkItemStatus.IN_PROGRESS,
-            'active': WorkItemStatus.IN_PROGRESS,
-            'done': WorkItemStatus.DONE,
-            'closed': WorkItemStatus.DONE,
-            'resolved': WorkItemStatus.DONE,
-            'blocked': WorkItemStatus.BLOCKED,
-            'cancelled': WorkItemStatus.CANCELLED
-        }
-        return mapping.get(jira_status.lower(), WorkItemStatus.TODO)
+        return _map_value(_JIRA_STATUS_MAP, jira_status, WorkItemStatus.TODO)
     
     def _map_jira_priority_to_unified(self, jira_priority: str) -> Priority:
         """Map JIRA priority to unified priority"""
-        mapping = {
-            'highest': Priority.CRITICAL,
-            'high': Priority.HIGH,
-            'medium': Priority.MEDIUM,
-            'low': Priority.LOW,
-            'lowest': Priority.LOW
-        }
-        return mapping.get(jira_priority.lower(), Priority.MEDIUM)
+        return _map_value(_JIRA_PRIORITY_MAP, jira_priority, Priority.MEDIUM)
     
     def _map_github_status_to_unified(self, github_status: str) -> WorkItemStatus:
         """Map GitHub issue status to unified work item status"""
-        mapping = {
-            'open': WorkItemStatus.TODO,
-            'closed': WorkItemStatus.DONE
-        }
-        return mapping.get(github_status.lower(), WorkItemStatus.TODO)
+        return _map_value(_GITHUB_STATUS_MAP, github_status, WorkItemStatus.TODO)
     
     def _map_azure_type_to_unified(self, azure_type: str) -> WorkItemType:
         """Map Azure DevOps work item type to unified type"""
-        mapping = {
-            'user story': WorkItemType.STORY,
-            'task': WorkItemType.TASK,
-            'bug': WorkItemType.BUG,
-            'epic': WorkItemType.EPIC,
-            'feature': WorkItemType.FEATURE
-        }
-        return mapping.get(azure_type.lower(), WorkItemType.TASK)
+        return _map_value(_AZURE_TYPE_MAP, azure_type, WorkItemType.TASK)
     
     def _map_azure_status_to_unified(self, azure_status: str) -> WorkItemStatus:
         """Map Azure DevOps status to unified status"""
-        mapping = {
-            'new': WorkItemStatus.TODO,
-            'active': WorkItemStatus.IN_PROGRESS,
-            'resolved': WorkItemStatus.DONE,
-            'closed': WorkItemStatus.DONE,
-            'removed': WorkItemStatus.CANCELLED
-        }
-        return mapping.get(azure_status.lower(), WorkItemStatus.TODO)
+        return _map_value(_AZURE_STATUS_MAP, azure_status, WorkItemStatus.TODO)
     
     def _post_process_response(self, response: UnifiedResponse, query: UnifiedQuery) -> UnifiedResponse:
-        """Apply post-processing to the response (deduplication, sorting, filtering)"""
-        # Apply limit if specified
-        if query.limit:
-            for entity_type in response.data:
-                response.data[entity_type] = response.data[entity_type][:query.limit]
+        """Apply post-processing to the response (sorting, then limiting) in one pass"""
+        sort_key = operator.attrgetter(query.sort_by) if query.sort_by else None
+        reverse = (query.sort_order or '').lower() == 'desc'
         
-        # Apply sorting if specified
-        if query.sort_by:
-            for entity_type in response.data:
+        entity_counts = {}
+        for entity_type, entities in response.data.items():
+            if sort_key:
                 try:
-                    reverse = query.sort_order.lower() == 'desc'
-                    response.data[entity_type].sort(
-                        key=lambda x: getattr(x, query.sort_by, ''),
-                        reverse=reverse
-                    )
+                    entities.sort(key=sort_key, reverse=reverse)
                 except Exception as e:
                     current_app.logger.warning(f"Could not sort {entity_type.value} by {query.sort_by}: {str(e)}")
+            
+            # Limit after sorting so the top items across all tools are kept
+            if query.limit and len(entities) > query.limit:
+                del entities[query.limit:]
+            entity_counts[entity_type.value] = len(entities)
         
         # Add metadata about the response
         response.metadata = {
-            'total_entities': sum(len(entities) for entities in response.data.values()),
-            'entity_counts': {entity_type.value: len(entities) for entity_type, entities in response.data.items()},
+            'total_entities': sum(entity_counts.values()),
+            'entity_counts': entity_counts,
             'query_applied': {
                 'limit': query.limit,
                 'sort_by': query.sort_by,
@@ -1,6 +1,13 @@
-from datetime import datetime, timezone
+from datetime import datetime, time, timedelta, timezone
 from app import db
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import event, func, insert, select, tuple_, union_all
+from sqlalchemy.orm import raiseload
+from sqlalchemy.dialects.postgresql import JSONB
+from cachetools import LRUCache
+import threading
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from flask_jwt_extended import create_access_token
 import enum
 
@@ -28,14 +35,33 @@ class RequestStatus(enum.Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+def enum_string(enum_cls):
+    """Store a Python Enum as its .value in a plain VARCHAR column.
+    
+    Avoids native MySQL ENUM columns, which need an ALTER TABLE for every
+    new member. Values are still validated against the Enum on bind.
+    """
+    return db.Enum(enum_cls, native_enum=False, length=32, validate_strings=True,
+                   values_callable=lambda members: [member.value for member in members])
+
+# JSON column type; binary JSONB on PostgreSQL (migration 9a3e6d1f4b70) so documents
+# aren't re-parsed per read. No GIN index: nothing filters on JSON keys in SQL.
+JSONDocument = db.JSON().with_variant(JSONB(), 'postgresql')
+
+# argon2id with the OWASP baseline parameters (19 MiB, 2 iterations)
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19 * 1024, parallelism=1)
+
 # Base model with common fields
 class BaseModel(db.Model):
     __abstract__ = True
     
     id = db.Column(db.Integer, primary_key=True)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), 
-                          onupdate=lambda: datetime.now(timezone.utc))
+    # Python defaults give ORM objects their UTC timestamps before flush; the
+    # server defaults cover Core/bulk INSERTs (sessions run in UTC, see
+    # db_utils.use_utc_sessions)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), server_default=func.now())
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), server_default=func.now(),
+                           onupdate=lambda: datetime.now(timezone.utc))
 
 # Tenant model (top level)
 class Tenant(BaseModel):
@@ -46,14 +72,17 @@ class Tenant(BaseModel):
     description = db.Column(db.Text)
     is_active = db.Column(db.Boolean, default=True)
     
-    # Relationships
-    users = db.relationship('User', backref='tenant', lazy='dynamic')
-    projects = db.relationship('Project', backref='tenant', lazy='dynamic')
-    tools = db.relationship('Tool', backref='tenant', lazy='dynamic')
+    # Relationships (users and projects grow without bound, so they load on access)
+    users = db.relationship('User', backref='tenant', lazy='select')
+    projects = db.relationship('Project', backref='tenant', lazy='select')
+    tools = db.relationship('Tool', backref='tenant', lazy='selectin')
 
 # Users table
 class User(BaseModel):
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_tenant_active', 'tenant_id', 'is_active'),
+    )
     
     tenant_id = db.Column(db.Integer, db.ForeignKey('tenants.id'), nullable=False)
     username = db.Column(db.String(80), unique=True, nullable=False)
@@ -61,16 +90,33 @@ class User(BaseModel):
     password_hash = db.Column(db.String(255), nullable=False)
     first_name = db.Column(db.String(50))
     last_name = db.Column(db.String(50))
-    role = db.Column(db.Enum(UserRole), default=UserRole.VIEWER)
+    role = db.Column(enum_string(UserRole), default=UserRole.VIEWER)
     is_active = db.Column(db.Boolean, default=True)
     last_login = db.Column(db.DateTime)
     teams_user_id = db.Column(db.String(200), unique=True, nullable=True)
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = _password_hasher.hash(password)
     
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        """Verify a password, upgrading legacy or outdated hashes in place.
+        
+        The upgraded hash is persisted by the caller's next commit.
+        """
+        if not self.password_hash.startswith('$argon2'):
+            # Hash from Werkzeug's generate_password_hash, from before argon2id
+            if not check_password_hash(self.password_hash, password):
+                return False
+            self.password_hash = _password_hasher.hash(password)
+            return True
+        
+        try:
+            _password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        if _password_hasher.check_needs_rehash(self.password_hash):
+            self.password_hash = _password_hasher.hash(password)
+        return True
     
     def generate_token(self):
         return create_access_token(identity=self.id)
@@ -78,6 +124,9 @@ class User(BaseModel):
 # Projects table
 class Project(BaseModel):
     __tablename__ = 'projects'
+    __table_args__ = (
+        db.Index('ix_projects_tenant_active', 'tenant_id', 'is_active'),
+    )
     
     tenant_id = db.Column(db.Integer, db.ForeignKey('tenants.id'), nullable=False)
     name = db.Column(db.String(100), nullable=False)
@@ -89,26 +138,29 @@ class Project(BaseModel):
     
     # Project manager
     manager_id = db.Column(db.Integer, db.ForeignKey('users.id'))
-    manager = db.relationship('User', backref='managed_projects')
+    manager = db.relationship('User', backref='managed_projects', lazy='joined')
     
     # Relationships
-    project_tools = db.relationship('ProjectTool', backref='project', lazy='dynamic')
-    chat_sessions = db.relationship('ChatSession', backref='project', lazy='dynamic')
+    project_tools = db.relationship('ProjectTool', backref='project', lazy='selectin')
+    chat_sessions = db.relationship('ChatSession', backref='project', lazy='select')
 
 # Tools table (JIRA, Azure DevOps, GitHub, etc.)
 class Tool(BaseModel):
     __tablename__ = 'tools'
+    __table_args__ = (
+        db.Index('ix_tools_tenant_type_active', 'tenant_id', 'tool_type', 'is_active'),
+    )
     
     tenant_id = db.Column(db.Integer, db.ForeignKey('tenants.id'), nullable=False)
     name = db.Column(db.String(100), nullable=False)
-    tool_type = db.Column(db.Enum(ToolType), nullable=False)
+    tool_type = db.Column(enum_string(ToolType), nullable=False)
     base_url = db.Column(db.String(255))
     api_token = db.Column(db.String(500))  # Encrypted
-    configuration = db.Column(db.JSON)  # Additional tool-specific config
+    configuration = db.Column(JSONDocument)  # Additional tool-specific config
     is_active = db.Column(db.Boolean, default=True)
     
-    # Relationships
-    project_tools = db.relationship('ProjectTool', backref='tool', lazy='dynamic')
+    # Relationships (a ProjectTool is almost always read together with its tool)
+    project_tools = db.relationship('ProjectTool', backref=db.backref('tool', lazy='joined'), lazy='selectin')
 
 # Many-to-many relationship between Projects and Tools
 class ProjectTool(BaseModel):
@@ -116,7 +168,7 @@ class ProjectTool(BaseModel):
     
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), nullable=False)
     tool_id = db.Column(db.Integer, db.ForeignKey('tools.id'), nullable=False)
-    configuration = db.Column(db.JSON)  # Project-specific tool configuration
+    configuration = db.Column(JSONDocument)  # Project-specific tool configuration
     is_active = db.Column(db.Boolean, default=True)
 
 # Chat sessions for tracking conversations
@@ -131,33 +183,55 @@ class ChatSession(BaseModel):
     
     # Relationships
     user = db.relationship('User', backref='chat_sessions')
-    messages = db.relationship('ChatMessage', backref='session', lazy='dynamic')
+    messages = db.relationship('ChatMessage', backref=db.backref('session', lazy='joined'), lazy='select')
 
 # Individual chat messages
 class ChatMessage(BaseModel):
     __tablename__ = 'chat_messages'
+    __table_args__ = (
+        db.Index('ix_chat_messages_session_created', 'session_id', 'created_at'),
+    )
     
     session_id = db.Column(db.Integer, db.ForeignKey('chat_sessions.id'), nullable=False)
     message_type = db.Column(db.String(20), nullable=False)  # user, assistant, system
     content = db.Column(db.Text, nullable=False)
-    message_metadata = db.Column(db.JSON)  # Additional message metadata
+    message_metadata = db.Column(JSONDocument)  # Additional message metadata
     
     # LLM usage tracking
-    llm_provider = db.Column(db.Enum(LLMProvider))
+    llm_provider = db.Column(enum_string(LLMProvider))
     model_name = db.Column(db.String(100))
+    model_pricing_id = db.Column(db.Integer, db.ForeignKey('model_pricing.id'), index=True)
     tokens_used = db.Column(db.Integer)
     cost = db.Column(db.Numeric(10, 6))
+    
+    @classmethod
+    def page(cls, session_id, before=None, limit=50):
+        """Newest-first page of a session's messages, keyset-paginated on (created_at, id).
+        
+        ``before`` is the (created_at, id) of the oldest message on the previous
+        page, so each page is an index range scan of ``limit`` rows however deep it is.
+        """
+        stmt = select(cls).where(cls.session_id == session_id).options(raiseload('*'))
+        if before:
+            stmt = stmt.where(tuple_(cls.created_at, cls.id) < tuple_(*before))
+        return db.session.scalars(stmt.order_by(cls.created_at.desc(), cls.id.desc()).limit(limit)).all()
 
 # Token usage tracking for cost analysis
 class TokenUsage(BaseModel):
     __tablename__ = 'token_usage'
+    __table_args__ = (
+        db.Index('ix_token_usage_user_created', 'user_id', 'created_at'),
+        db.Index('ix_token_usage_project_created', 'project_id', 'created_at'),
+        db.Index('ix_token_usage_session', 'session_id'),
+    )
     
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'))
     session_id = db.Column(db.Integer, db.ForeignKey('chat_sessions.id'))
     
-    llm_provider = db.Column(db.Enum(LLMProvider), nullable=False)
+    llm_provider = db.Column(enum_string(LLMProvider), nullable=False)
     model_name = db.Column(db.String(100), nullable=False)
+    model_pricing_id = db.Column(db.Integer, db.ForeignKey('model_pricing.id'), index=True)
     
     # Token details
     prompt_tokens = db.Column(db.Integer, default=0)
@@ -172,7 +246,36 @@ class TokenUsage(BaseModel):
     # Request details
     request_id = db.Column(db.String(100))
     response_time_ms = db.Column(db.Integer)
-    status = db.Column(db.Enum(RequestStatus), default=RequestStatus.COMPLETED)
+    status = db.Column(enum_string(RequestStatus), default=RequestStatus.COMPLETED)
+    
+    @classmethod
+    def totals(cls, user_id, project_id=None, since=None):
+        """Return (total_tokens, total_cost) for a user in a single SUM query"""
+        stmt = select(
+            func.coalesce(func.sum(cls.total_tokens), 0),
+            func.coalesce(func.sum(cls.total_cost), 0)
+        ).where(cls.user_id == user_id)
+        if project_id is not None:
+            stmt = stmt.where(cls.project_id == project_id)
+        if since is not None:
+            stmt = stmt.where(cls.created_at >= since)
+        return db.session.execute(stmt).one()
+    
+    @classmethod
+    def record_many(cls, rows):
+        """Insert usage rows (dicts of column values) as one executemany INSERT.
+        
+        ORM bulk inserts skip mapper events, so model_pricing_id is resolved
+        here instead of by the before_insert listener.
+        """
+        if not rows:
+            return
+        connection = db.session.connection()
+        db.session.execute(insert(cls), [
+            row if row.get('model_pricing_id') is not None else dict(
+                row, model_pricing_id=_pricing_id(connection, row['llm_provider'], row['model_name']))
+            for row in rows
+        ])
     
     # Relationships
     user = db.relationship('User', backref='token_usage')
@@ -182,11 +285,15 @@ class TokenUsage(BaseModel):
 # API usage tracking
 class APIUsage(BaseModel):
     __tablename__ = 'api_usage'
+    __table_args__ = (
+        db.Index('ix_api_usage_user_created', 'user_id', 'created_at'),
+        db.Index('ix_api_usage_project_created', 'project_id', 'created_at'),
+    )
     
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'))
     
-    tool_type = db.Column(db.Enum(ToolType), nullable=False)
+    tool_type = db.Column(enum_string(ToolType), nullable=False)
     endpoint = db.Column(db.String(200), nullable=False)
     method = db.Column(db.String(10), nullable=False)
     
@@ -199,6 +306,25 @@ class APIUsage(BaseModel):
     # Cost tracking (if applicable)
     cost = db.Column(db.Numeric(10, 6), default=0)
     
+    @classmethod
+    def totals(cls, user_id, project_id=None, since=None):
+        """Return (request_count, total_cost) for a user in a single aggregate query"""
+        stmt = select(
+            func.count(cls.id),
+            func.coalesce(func.sum(cls.cost), 0)
+        ).where(cls.user_id == user_id)
+        if project_id is not None:
+            stmt = stmt.where(cls.project_id == project_id)
+        if since is not None:
+            stmt = stmt.where(cls.created_at >= since)
+        return db.session.execute(stmt).one()
+    
+    @classmethod
+    def record_many(cls, rows):
+        """Insert API usage rows (dicts of column values) as one executemany INSERT"""
+        if rows:
+            db.session.execute(insert(cls), rows)
+    
     # Relationships
     user = db.relationship('User', backref='api_usage')
     project = db.relationship('Project', backref='api_usage')
@@ -206,6 +332,10 @@ class APIUsage(BaseModel):
 # Agent execution tracking
 class AgentExecution(BaseModel):
     __tablename__ = 'agent_executions'
+    __table_args__ = (
+        db.Index('ix_agent_executions_user_created', 'user_id', 'created_at'),
+        db.Index('ix_agent_executions_project_status_start', 'project_id', 'status', 'start_time'),
+    )
     
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'))
@@ -215,13 +345,13 @@ class AgentExecution(BaseModel):
     task_description = db.Column(db.Text)
     
     # Execution details
-    start_time = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    start_time = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), server_default=func.now())
     end_time = db.Column(db.DateTime)
     duration_seconds = db.Column(db.Integer)
-    status = db.Column(db.Enum(RequestStatus), default=RequestStatus.PENDING)
+    status = db.Column(enum_string(RequestStatus), default=RequestStatus.PENDING)
     
     # Results
-    output = db.Column(db.JSON)
+    output = db.Column(JSONDocument)
     error_message = db.Column(db.Text)
     
     # Cost tracking
@@ -233,6 +363,102 @@ class AgentExecution(BaseModel):
     project = db.relationship('Project', backref='agent_executions')
     session = db.relationship('ChatSession', backref='agent_executions')
 
+# Daily token usage rollup for cost dashboards
+class TokenUsageDaily(BaseModel):
+    __tablename__ = 'token_usage_daily'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'project_id', 'llm_provider', 'model_name', 'day',
+                            name='uq_token_usage_daily_key'),
+        db.Index('ix_token_usage_daily_user_day', 'user_id', 'day'),
+    )
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id'))
+    
+    llm_provider = db.Column(enum_string(LLMProvider), nullable=False)
+    model_name = db.Column(db.String(100), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    
+    # Aggregated totals for the day
+    prompt_tokens = db.Column(db.Integer, default=0)
+    completion_tokens = db.Column(db.Integer, default=0)
+    total_tokens = db.Column(db.Integer, default=0)
+    total_cost = db.Column(db.Numeric(12, 6), default=0)
+    
+    @classmethod
+    def rolled_up_through(cls):
+        """Last day already aggregated, or None if nothing has been rolled up yet"""
+        return db.session.scalar(select(func.max(cls.day)))
+    
+    @classmethod
+    def _tail_start(cls):
+        """First TokenUsage timestamp not covered by the rollup"""
+        last = cls.rolled_up_through()
+        return datetime.combine(last + timedelta(days=1), time.min) if last else None
+    
+    @classmethod
+    def refresh(cls, today=None):
+        """Aggregate every complete day of TokenUsage that is not rolled up yet.
+        
+        Only days before ``today`` (UTC) are written, so each day is inserted
+        exactly once and the current day is always served from the raw table.
+        Returns the number of rollup rows inserted.
+        """
+        today = today or datetime.now(timezone.utc).date()
+        start = cls._tail_start()
+        day = func.date(TokenUsage.created_at)
+        
+        rows = select(
+            TokenUsage.user_id, TokenUsage.project_id, TokenUsage.llm_provider,
+            TokenUsage.model_name, day,
+            func.coalesce(func.sum(TokenUsage.prompt_tokens), 0),
+            func.coalesce(func.sum(TokenUsage.completion_tokens), 0),
+            func.coalesce(func.sum(TokenUsage.total_tokens), 0),
+            func.coalesce(func.sum(TokenUsage.total_cost), 0),
+            func.now(), func.now()
+        ).where(TokenUsage.created_at < datetime.combine(today, time.min))
+        if start:
+            rows = rows.where(TokenUsage.created_at >= start)
+        rows = rows.group_by(TokenUsage.user_id, TokenUsage.project_id, TokenUsage.llm_provider,
+                             TokenUsage.model_name, day)
+        
+        result = db.session.execute(insert(cls).from_select(
+            ['user_id', 'project_id', 'llm_provider', 'model_name', 'day',
+             'prompt_tokens', 'completion_tokens', 'total_tokens', 'total_cost',
+             'created_at', 'updated_at'],
+            rows
+        ))
+        db.session.commit()
+        return result.rowcount
+    
+    @classmethod
+    def totals(cls, user_id, project_id=None):
+        """Return (total_tokens, total_cost) for a user, optionally scoped to a project.
+        
+        Rolled-up days are unioned with the raw TokenUsage rows recorded since
+        the last rollup, so the figures are current without scanning history.
+        """
+        start = cls._tail_start()
+        rolled = select(cls.total_tokens.label('tokens'), cls.total_cost.label('cost')).where(
+            cls.user_id == user_id)
+        tail = select(TokenUsage.total_tokens, TokenUsage.total_cost).where(
+            TokenUsage.user_id == user_id)
+        if project_id is not None:
+            rolled = rolled.where(cls.project_id == project_id)
+            tail = tail.where(TokenUsage.project_id == project_id)
+        if start:
+            tail = tail.where(TokenUsage.created_at >= start)
+        
+        usage = union_all(rolled, tail).subquery()
+        return db.session.execute(select(
+            func.coalesce(func.sum(usage.c.tokens), 0),
+            func.coalesce(func.sum(usage.c.cost), 0)
+        )).one()
+    
+    # Relationships
+    user = db.relationship('User', backref='token_usage_daily')
+    project = db.relationship('Project', backref='token_usage_daily')
+
 # System configuration for dynamic settings
 class SystemConfig(BaseModel):
     __tablename__ = 'system_config'
@@ -246,9 +472,45 @@ class SystemConfig(BaseModel):
 class ModelPricing(BaseModel):
     __tablename__ = 'model_pricing'
     
-    provider = db.Column(db.Enum(LLMProvider), nullable=False)
+    provider = db.Column(enum_string(LLMProvider), nullable=False)
     model_name = db.Column(db.String(100), nullable=False)
     prompt_price_per_1k = db.Column(db.Numeric(10, 6), nullable=False)
     completion_price_per_1k = db.Column(db.Numeric(10, 6), nullable=False)
     currency = db.Column(db.String(3), default='USD')
-    is_active = db.Column(db.Boolean, default=True) 
\ No newline at end of file
+    is_active = db.Column(db.Boolean, default=True)
+
+# Pricing row ids keyed by (provider, model_name), resolved once per process
+_pricing_ids = LRUCache(maxsize=128)
+_pricing_ids_lock = threading.Lock()
+
+def _pricing_id(connection, provider, model_name):
+    """Return the active ModelPricing id for a provider/model, or None"""
+    key = (provider, model_name)
+    with _pricing_ids_lock:
+        if key in _pricing_ids:
+            return _pricing_ids[key]
+    pricing_id = connection.scalar(
+        select(ModelPricing.id).where(
+            ModelPricing.provider == provider,
+            ModelPricing.model_name == model_name,
+            ModelPricing.is_active.is_(True)
+        ).limit(1)
+    )
+    with _pricing_ids_lock:
+        _pricing_ids[key] = pricing_id
+    return pricing_id
+
+@event.listens_for(TokenUsage, 'before_insert')
+@event.listens_for(ChatMessage, 'before_insert')
+def _resolve_model_pricing(mapper, connection, target):
+    """Stamp model_pricing_id at write time so cost queries join on an integer key"""
+    if target.model_pricing_id is None and target.llm_provider and target.model_name:
+        target.model_pricing_id = _pricing_id(connection, target.llm_provider, target.model_name)
+
+@event.listens_for(ModelPricing, 'after_insert')
+@event.listens_for(ModelPricing, 'after_update')
+@event.listens_for(ModelPricing, 'after_delete')
+def _clear_pricing_ids(mapper, connection, target):
+    """Drop cached pricing ids whenever pricing rows change"""
+    with _pricing_ids_lock:
+        _pricing_ids.clear()
@@ -30,5 +30,5 @@ echo "✅ Database initialization complete!"
 
 # Now start Gunicorn (your wsgi.py already exists)
 echo "🚀 Starting Gunicorn server..."
-uvicorn wsgi:asgi_app --host 0.0.0.0 --port 5000
+exec gunicorn -c /app/gunicorn.conf.py wsgi:asgi_app
 
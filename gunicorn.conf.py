@@ -0,0 +1,46 @@
+"""
+Gunicorn configuration for PM Bot API
+
+Launch with: gunicorn -c gunicorn.conf.py wsgi:asgi_app
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'uvicorn.workers.UvicornWorker'
+
+# Import the app once in the master and fork workers from it (copy-on-write)
+preload_app = True
+
+# Keep warm workers instead of recycling them; 0 disables recycling. If a leak
+# ever needs a safety net, set a large value - replacements are warmed in
+# post_worker_init before they accept connections
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 0))
+
+
+def post_fork(server, worker):
+    """Give each worker its own connection pool instead of the one inherited from the master"""
+    from app import db
+    from wsgi import app
+
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+
+def post_worker_init(worker):
+    """Warm the worker before it starts accepting connections.
+
+    One synthetic request finalizes the URL map and request machinery, and a
+    checkout opens the worker's first pooled database connection.
+    """
+    from app import db
+    from wsgi import app
+
+    with app.test_client() as client:
+        client.get('/api/v1/health')
+    with app.app_context():
+        try:
+            db.engine.connect().close()
+        except Exception as e:
+            app.logger.warning(f"Worker database warm-up skipped: {str(e)}")
@@ -29,8 +29,7 @@ def init_database():
             is_active=True
         )
         db.session.add(tenant)
-        db.session.commit()
-        print("✅ Demo tenant created!")
+        db.session.flush()  # assigns tenant.id without committing
         
         # Create sample user
         user = User(
@@ -43,8 +42,7 @@ def init_database():
         )
         user.set_password('password123')
         db.session.add(user)
-        db.session.commit()
-        print("✅ Admin user created!")
+        db.session.flush()  # assigns user.id for the project manager
         
         # Create sample project
         project = Project(
@@ -56,7 +54,11 @@ def init_database():
             is_active=True
         )
         db.session.add(project)
+        
+        # Write the sample data in a single transaction
         db.session.commit()
+        print("✅ Demo tenant created!")
+        print("✅ Admin user created!")
         print("✅ Sample project created!")
         
         print("\n🎉 Database initialization complete!")
@@ -0,0 +1,38 @@
+"""Add tenant-scoped composite indexes
+
+Revision ID: 1b9d7e3f5c62
+Revises: f4a6b2c8d913
+Create Date: 2026-10-16 16:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b9d7e3f5c62'
+down_revision = 'f4a6b2c8d913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_tenant_active', ['tenant_id', 'is_active'], unique=False)
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.create_index('ix_projects_tenant_active', ['tenant_id', 'is_active'], unique=False)
+
+    with op.batch_alter_table('tools', schema=None) as batch_op:
+        batch_op.create_index('ix_tools_tenant_type_active', ['tenant_id', 'tool_type', 'is_active'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tools', schema=None) as batch_op:
+        batch_op.drop_index('ix_tools_tenant_type_active')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_tenant_active')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_tenant_active')
@@ -0,0 +1,48 @@
+"""Store enum columns as VARCHAR values instead of native ENUMs
+
+Revision ID: 5e0c4a9b8d17
+Revises: 1b9d7e3f5c62
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0c4a9b8d17'
+down_revision = '1b9d7e3f5c62'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, enum member names, nullable)
+ENUM_COLUMNS = (
+    ('users', 'role', ('ADMIN', 'PROJECT_MANAGER', 'DEVELOPER', 'VIEWER'), True),
+    ('tools', 'tool_type', ('JIRA', 'AZURE_DEVOPS', 'GITHUB', 'SLACK', 'TEAMS'), False),
+    ('chat_messages', 'llm_provider', ('OPENAI', 'AZURE_OPENAI', 'ANTHROPIC'), True),
+    ('token_usage', 'llm_provider', ('OPENAI', 'AZURE_OPENAI', 'ANTHROPIC'), False),
+    ('token_usage', 'status', ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED'), True),
+    ('api_usage', 'tool_type', ('JIRA', 'AZURE_DEVOPS', 'GITHUB', 'SLACK', 'TEAMS'), False),
+    ('agent_executions', 'status', ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED'), True),
+    ('token_usage_daily', 'llm_provider', ('OPENAI', 'AZURE_OPENAI', 'ANTHROPIC'), False),
+    ('model_pricing', 'provider', ('OPENAI', 'AZURE_OPENAI', 'ANTHROPIC'), False),
+)
+
+
+def upgrade():
+    # Every enum value is the lower-cased member name, so the stored names
+    # convert in place once the column is a VARCHAR
+    for table, column, names, nullable in ENUM_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.Enum(*names), type_=sa.String(length=32),
+                                  existing_nullable=nullable)
+        op.execute(sa.text(f'UPDATE {table} SET {column} = LOWER({column})'))
+
+
+def downgrade():
+    for table, column, names, nullable in reversed(ENUM_COLUMNS):
+        op.execute(sa.text(f'UPDATE {table} SET {column} = UPPER({column})'))
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.String(length=32), type_=sa.Enum(*names),
+                                  existing_nullable=nullable)
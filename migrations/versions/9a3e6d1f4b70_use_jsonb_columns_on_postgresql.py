@@ -0,0 +1,43 @@
+"""Convert JSON document columns to JSONB on PostgreSQL
+
+Revision ID: 9a3e6d1f4b70
+Revises: 5e0c4a9b8d17
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '9a3e6d1f4b70'
+down_revision = '5e0c4a9b8d17'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs typed as models.JSONDocument
+JSON_COLUMNS = (
+    ('tools', 'configuration'),
+    ('project_tools', 'configuration'),
+    ('chat_messages', 'message_metadata'),
+    ('agent_executions', 'output'),
+)
+
+
+def upgrade():
+    # MySQL and SQLite keep their native JSON type, so there is nothing to do
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column in JSON_COLUMNS:
+        op.alter_column(table, column, existing_type=sa.JSON(), type_=postgresql.JSONB(),
+                        postgresql_using=f'{column}::jsonb')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column in reversed(JSON_COLUMNS):
+        op.alter_column(table, column, existing_type=postgresql.JSONB(), type_=sa.JSON(),
+                        postgresql_using=f'{column}::json')
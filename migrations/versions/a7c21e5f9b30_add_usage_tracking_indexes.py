@@ -0,0 +1,52 @@
+"""Add composite indexes to usage tracking tables
+
+Revision ID: a7c21e5f9b30
+Revises: 4d3ff899f64e
+Create Date: 2026-10-16 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c21e5f9b30'
+down_revision = '4d3ff899f64e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('token_usage', schema=None) as batch_op:
+        batch_op.create_index('ix_token_usage_user_created', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_token_usage_project_created', ['project_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_token_usage_session', ['session_id'], unique=False)
+
+    with op.batch_alter_table('api_usage', schema=None) as batch_op:
+        batch_op.create_index('ix_api_usage_user_created', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_api_usage_project_created', ['project_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('agent_executions', schema=None) as batch_op:
+        batch_op.create_index('ix_agent_executions_user_created', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_agent_executions_project_status_start', ['project_id', 'status', 'start_time'], unique=False)
+
+    with op.batch_alter_table('chat_messages', schema=None) as batch_op:
+        batch_op.create_index('ix_chat_messages_session_created', ['session_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('chat_messages', schema=None) as batch_op:
+        batch_op.drop_index('ix_chat_messages_session_created')
+
+    with op.batch_alter_table('agent_executions', schema=None) as batch_op:
+        batch_op.drop_index('ix_agent_executions_project_status_start')
+        batch_op.drop_index('ix_agent_executions_user_created')
+
+    with op.batch_alter_table('api_usage', schema=None) as batch_op:
+        batch_op.drop_index('ix_api_usage_project_created')
+        batch_op.drop_index('ix_api_usage_user_created')
+
+    with op.batch_alter_table('token_usage', schema=None) as batch_op:
+        batch_op.drop_index('ix_token_usage_session')
+        batch_op.drop_index('ix_token_usage_project_created')
+        batch_op.drop_index('ix_token_usage_user_created')
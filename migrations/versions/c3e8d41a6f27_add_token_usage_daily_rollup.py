@@ -0,0 +1,46 @@
+"""Add token_usage_daily rollup table
+
+Revision ID: c3e8d41a6f27
+Revises: a7c21e5f9b30
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e8d41a6f27'
+down_revision = 'a7c21e5f9b30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('token_usage_daily',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=True),
+    sa.Column('llm_provider', sa.Enum('OPENAI', 'AZURE_OPENAI', 'ANTHROPIC', name='llmprovider'), nullable=False),
+    sa.Column('model_name', sa.String(length=100), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=True),
+    sa.Column('completion_tokens', sa.Integer(), nullable=True),
+    sa.Column('total_tokens', sa.Integer(), nullable=True),
+    sa.Column('total_cost', sa.Numeric(precision=12, scale=6), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'project_id', 'llm_provider', 'model_name', 'day', name='uq_token_usage_daily_key')
+    )
+    with op.batch_alter_table('token_usage_daily', schema=None) as batch_op:
+        batch_op.create_index('ix_token_usage_daily_user_day', ['user_id', 'day'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('token_usage_daily', schema=None) as batch_op:
+        batch_op.drop_index('ix_token_usage_daily_user_day')
+
+    op.drop_table('token_usage_daily')
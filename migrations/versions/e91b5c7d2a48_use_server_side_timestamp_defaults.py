@@ -0,0 +1,43 @@
+"""Use server-side defaults for timestamp columns
+
+Revision ID: e91b5c7d2a48
+Revises: c3e8d41a6f27
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e91b5c7d2a48'
+down_revision = 'c3e8d41a6f27'
+branch_labels = None
+depends_on = None
+
+
+TABLES = (
+    'tenants', 'users', 'projects', 'tools', 'project_tools', 'chat_sessions',
+    'chat_messages', 'token_usage', 'api_usage', 'agent_executions',
+    'token_usage_daily', 'system_config', 'model_pricing',
+)
+
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=sa.func.now())
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=sa.func.now())
+
+    with op.batch_alter_table('agent_executions', schema=None) as batch_op:
+        batch_op.alter_column('start_time', existing_type=sa.DateTime(), server_default=sa.func.now())
+
+
+def downgrade():
+    with op.batch_alter_table('agent_executions', schema=None) as batch_op:
+        batch_op.alter_column('start_time', existing_type=sa.DateTime(), server_default=None)
+
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=None)
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
@@ -0,0 +1,40 @@
+"""Add model_pricing_id to token_usage and chat_messages
+
+Revision ID: f4a6b2c8d913
+Revises: e91b5c7d2a48
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4a6b2c8d913'
+down_revision = 'e91b5c7d2a48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('token_usage', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('model_pricing_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_token_usage_model_pricing_id'), ['model_pricing_id'], unique=False)
+        batch_op.create_foreign_key('fk_token_usage_model_pricing_id', 'model_pricing', ['model_pricing_id'], ['id'])
+
+    with op.batch_alter_table('chat_messages', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('model_pricing_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_chat_messages_model_pricing_id'), ['model_pricing_id'], unique=False)
+        batch_op.create_foreign_key('fk_chat_messages_model_pricing_id', 'model_pricing', ['model_pricing_id'], ['id'])
+
+
+def downgrade():
+    with op.batch_alter_table('chat_messages', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_chat_messages_model_pricing_id', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_chat_messages_model_pricing_id'))
+        batch_op.drop_column('model_pricing_id')
+
+    with op.batch_alter_table('token_usage', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_token_usage_model_pricing_id', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_token_usage_model_pricing_id'))
+        batch_op.drop_column('model_pricing_id')
@@ -1,27 +1,38 @@
 #!/usr/bin/env python3
 
+import gc
+import importlib.util
+import logging
 import os
 import sys
 
-# Add current directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+# Add this directory to the Python path only if the app package isn't already importable
+if importlib.util.find_spec('app') is None:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app import create_app
-from config import config
+from config import get_config
 
-env = os.environ.get('ENVIRONMENT', 'development')
-config_class = config.get(env, config['default'])
+config_class = get_config()
 
 app = create_app(config_class)
 
-print(f"✓ Successfully created Flask app using factory pattern")
-print(f"✓ Environment: {env}")
-print(f"✓ Config class: {config_class.__name__}")
-print(f"✓ Database configured: {bool(app.config.get('SQLALCHEMY_DATABASE_URI'))}")
+# Compile mappers and warm the connection pool before serving traffic
+from app.db_utils import warm_up
+warm_up(app)
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('WSGI_LOG_LEVEL', 'WARNING').upper())
+logger.debug("Created Flask app (environment=%s, config=%s, database configured=%s)",
+             app.config.get('ENVIRONMENT'), config_class.__name__,
+             bool(app.config.get('SQLALCHEMY_DATABASE_URI')))
 
 # WRAP FLASK AS ASGI
 from asgiref.wsgi import WsgiToAsgi
 
 asgi_app = WsgiToAsgi(app)
+
+# Move everything built at import time into the permanent generation, so the
+# GC in forked workers doesn't touch (and un-share) the preloaded pages
+gc.collect()
+gc.freeze()